@@ -1,5 +1,12 @@
+import argparse
+import asyncio
+import json
+import os
 import random
+import struct
 import sys
+import time
+from array import array
 
 # --------------------------
 # სიტყვების სია კატეგორიებად
@@ -95,6 +102,315 @@ HANGMAN_PICS = [
 
 MAX_ERRORS = len(HANGMAN_PICS) - 1  # მაქსიმალური შეცდომების რაოდენობა
 
+# ---------------------------
+#       თამაშის ძრავი
+# ---------------------------
+# ასოები ბიტებად: ქართული ანბანის 33 ასო იღებს 0..32 ბიტებს, ნებისმიერი სხვა
+# ასო (მაგ. ლათინური) პირველად შეხვედრისას შემდეგ თავისუფალ ბიტს
+ALPHABET = "აბგდევზთიკლმნოპჟრსტუფქღყშჩცძწჭხჯჰ"
+LETTERS = list(ALPHABET)
+LETTER_BITS = {ch: 1 << i for i, ch in enumerate(ALPHABET)}
+
+# სვლის შედეგები
+HIT, MISS, REPEAT, WON, LOST = "hit", "miss", "repeat", "won", "lost"
+
+
+def letter_bit(letter):
+    bit = LETTER_BITS.get(letter)
+    if bit is None:
+        bit = LETTER_BITS[letter] = 1 << len(LETTERS)
+        LETTERS.append(letter)
+    return bit
+
+
+def word_mask(word):
+    # სიტყვის ასოების ბიტური სიმრავლე (არა-ასოები, მაგ. "-", არ ითვლება)
+    mask = 0
+    for ch in word.lower():
+        if ch.isalpha():
+            mask |= letter_bit(ch)
+    return mask
+
+
+def mask_letters(mask):
+    # ბიტური სიმრავლე -> ასოები ანბანის რიგით
+    return [LETTERS[i] for i in range(mask.bit_length()) if mask >> i & 1]
+
+
+def step(letters, guessed, tried, wrong, bit, max_errors):
+    # თამაშის წესი ერთ ადგილას: ერთი ასოს (bit) სვლა მთელ რიცხვებზე.
+    # აბრუნებს (შედეგი, guessed, tried, wrong); იყენებს HangmanGame და simulate
+    if tried & bit:
+        return REPEAT, guessed, tried, wrong
+    tried |= bit
+    if letters & bit:
+        guessed |= bit
+        return (WON if guessed == letters else HIT), guessed, tried, wrong
+    wrong += 1
+    return (LOST if wrong >= max_errors else MISS), guessed, tried, wrong
+
+
+class HangmanGame:
+    # ერთი თამაშის მდგომარეობა input()/print-ის გარეშე; მოგება/წაგება O(1)
+    __slots__ = ("word", "word_lower", "letters", "guessed", "tried", "wrong",
+                 "max_errors", "tried_words")
+
+    def __init__(self, word, max_errors=MAX_ERRORS):
+        self.word = word
+        self.word_lower = word.lower()
+        # სიტყვის ასოები, გამოცნობილი ასოები და ყველა ნაცადი ასო — ბიტური სიმრავლეები
+        self.letters = word_mask(word)
+        self.guessed = 0
+        self.tried = 0
+        self.wrong = 0
+        self.max_errors = max_errors
+        self.tried_words = set()
+
+    @property
+    def won(self):
+        return self.guessed == self.letters
+
+    @property
+    def lost(self):
+        return self.wrong >= self.max_errors
+
+    @property
+    def over(self):
+        return self.guessed == self.letters or self.wrong >= self.max_errors
+
+    @property
+    def attempts_left(self):
+        return self.max_errors - self.wrong
+
+    def guess_letter(self, letter):
+        if self.over:
+            raise ValueError("თამაში უკვე დასრულებულია.")
+        result, self.guessed, self.tried, self.wrong = step(
+            self.letters, self.guessed, self.tried, self.wrong,
+            letter_bit(letter.lower()), self.max_errors)
+        return result
+
+    def guess_word(self, word):
+        if self.over:
+            raise ValueError("თამაში უკვე დასრულებულია.")
+        word = word.lower()
+        if word in self.tried_words:
+            return REPEAT
+        self.tried_words.add(word)
+        if word == self.word_lower:
+            self.guessed = self.letters
+            return WON
+        self.wrong += 1
+        return LOST if self.wrong >= self.max_errors else MISS
+
+    def guess(self, text):
+        # ერთი ასო ან მთელი სიტყვა
+        return self.guess_letter(text) if len(text) == 1 else self.guess_word(text)
+
+    def mask(self):
+        guessed = self.guessed
+        return " ".join(
+            ch if not ch.isalpha() or LETTER_BITS.get(ch.lower(), 0) & guessed else "_"
+            for ch in self.word
+        )
+
+    def guessed_letters(self):
+        return mask_letters(self.guessed)
+
+
+def frequency_order(words):
+    # ასოები სიტყვების რაოდენობის მიხედვით, რომელშიც გვხვდება (ხშირიდან იშვიათისკენ)
+    counts = {}
+    for word in words:
+        for letter in mask_letters(word_mask(word)):
+            counts[letter] = counts.get(letter, 0) + 1
+    order = sorted(counts, key=lambda ch: (-counts[ch], LETTER_BITS[ch]))
+    return order + [ch for ch in ALPHABET if ch not in counts]
+
+
+def simulate(words, games, order=None, shuffle=False, max_errors=MAX_ERRORS, seed=None):
+    # ავტომატური თამაშები: ასოები order-ის რიგით (shuffle=True — ყოველ თამაშში
+    # შემთხვევითი რიგით). აბრუნებს {"games", "won", "guesses", "seconds"}
+    rng = random.Random(seed)
+    masks = [word_mask(word) for word in words]
+    bits = [letter_bit(ch) for ch in (order or frequency_order(words))]
+    orders = [bits]
+    if shuffle:
+        orders = [rng.sample(bits, len(bits)) for _ in range(min(games, 1024))]
+    picks = [rng.randrange(len(masks)) for _ in range(games)]
+
+    won = guesses = 0
+    start = time.perf_counter()
+    for n, pick in enumerate(picks):
+        letters = masks[pick]
+        guessed = tried = wrong = 0
+        for bit in orders[n % len(orders)]:
+            guesses += 1
+            result, guessed, tried, wrong = step(letters, guessed, tried, wrong, bit, max_errors)
+            if result is WON:
+                won += 1
+                break
+            if result is LOST:
+                break
+    elapsed = time.perf_counter() - start
+    return {"games": games, "won": won, "guesses": guesses, "seconds": elapsed}
+
+
+# ---------------------------
+#     სიტყვების კორპუსი
+# ---------------------------
+# დიდი კატეგორიები იტვირთება CORPUS_DIR/<კატეგორია>.txt ფაილებიდან (თითო სიტყვა ხაზზე);
+# ინდექსი ინახება <კატეგორია>.idx ბინარულ ფაილში და ხელახლა იგება მხოლოდ მაშინ,
+# როცა .txt ფაილის mtime/ზომა შეიცვალა
+CORPUS_DIR = "words"
+DIFFICULTY_BANDS = ("მარტივი", "საშუალო", "რთული")
+
+INDEX_MAGIC = b"HANGIDX2"
+INDEX_HEADER = struct.Struct("<8sqqIQ")
+
+
+class WordIndex:
+    # კატეგორიის სიტყვები დალაგებული მარტივიდან რთულისკენ; სირთულის ზოლი ამიტომ
+    # უბრალოდ ინდექსების დიაპაზონია. თითო სიტყვაზე ინახება სიხშირის ქულა (ასოების
+    # საშუალო გავრცელება კატეგორიაში — რაც უფრო იშვიათი ასოებია, მით უფრო რთულია
+    # გამოცნობა); განსხვავებული ასოების რაოდენობა მხოლოდ აგებისას, რიგისთვის გამოიყენება
+    def __init__(self, words, scores, seed=None):
+        self.words = words
+        self.scores = scores
+        # shuffle-bag თითო ზოლზე: არეული ინდექსები, ამოღება — pop() ბოლოდან
+        self.__bags = {}
+        self.__rng = random.Random(seed)
+
+    def __len__(self):
+        return len(self.words)
+
+    @classmethod
+    def build(cls, words, seed=None):
+        words = list(dict.fromkeys(words))
+        masks = [word_mask(word) for word in words]
+        counts = {}
+        for mask in masks:
+            while mask:
+                low = mask & -mask
+                counts[low] = counts.get(low, 0) + 1
+                mask ^= low
+        total = len(words) or 1
+        scores = []
+        for mask in masks:
+            letters = [counts[1 << i] for i in range(mask.bit_length()) if mask >> i & 1]
+            scores.append(sum(letters) / (len(letters) * total) if letters else 0.0)
+        # მარტივი: გავრცელებული ასოები და მეტი განსხვავებული ასო
+        order = sorted(range(len(words)),
+                       key=lambda i: (-scores[i], -masks[i].bit_count(), words[i]))
+        return cls([words[i] for i in order],
+                   array("f", (scores[i] for i in order)),
+                   seed)
+
+    def save(self, filename, source_stamp=(0, 0)):
+        blob = "\n".join(self.words).encode("utf-8")
+        tmp = filename + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, *source_stamp, len(self.words), len(blob)))
+            f.write(blob)
+            scores = array("f", self.scores)
+            if sys.byteorder != "little":
+                scores.byteswap()
+            scores.tofile(f)
+        os.replace(tmp, filename)
+
+    @classmethod
+    def load(cls, filename, source_stamp=None, seed=None):
+        # None, თუ ფაილი არ არსებობს, დაზიანებულია ან სხვა წყაროდანაა აგებული
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < INDEX_HEADER.size:
+            return None
+        magic, mtime_ns, size, count, blob_size = INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC or (source_stamp is not None and (mtime_ns, size) != source_stamp):
+            return None
+        pos = INDEX_HEADER.size
+        words = data[pos:pos + blob_size].decode("utf-8").split("\n") if count else []
+        pos += blob_size
+        scores = array("f")
+        end = pos + scores.itemsize * count
+        scores.frombytes(data[pos:end])
+        if sys.byteorder != "little":
+            scores.byteswap()
+        if len(words) != count or end != len(data):
+            return None
+        return cls(words, scores, seed)
+
+    def band(self, difficulty):
+        # სირთულის ზოლის ინდექსების დიაპაზონი (სიტყვების მესამედები)
+        n = len(self.words)
+        k = DIFFICULTY_BANDS.index(difficulty)
+        return range(n * k // len(DIFFICULTY_BANDS), n * (k + 1) // len(DIFFICULTY_BANDS))
+
+    def draw(self, difficulty=None):
+        # შემთხვევითი სიტყვა დაბრუნების გარეშე: ზოლის ყველა სიტყვა გამოჩნდება,
+        # სანამ რომელიმე განმეორდება. ამოღება O(1), არევა — ერთხელ ყოველ გავლაზე
+        bag = self.__bags.get(difficulty)
+        if not bag:
+            ids = range(len(self.words))
+            if difficulty is not None:
+                # პატარა კატეგორიაში (< 3 სიტყვა) ზოლი შეიძლება ცარიელი იყოს — მაშინ მთელი კატეგორია
+                ids = self.band(difficulty) or ids
+            if not ids:
+                raise ValueError("კატეგორია ცარიელია.")
+            bag = self.__bags[difficulty] = list(ids)
+            self.__rng.shuffle(bag)
+        return self.words[bag.pop()]
+
+
+# კატეგორია -> WordIndex (ჩაშენებული კატეგორიებისთვის იგება პირველ გამოყენებაზე)
+WORD_INDEXES = {}
+
+
+def read_word_file(filename):
+    with open(filename, encoding="utf-8") as f:
+        for line in f:
+            word = line.strip().lower()
+            if word and any(ch.isalpha() for ch in word) and all(ch.isalpha() or ch == "-" for ch in word):
+                yield word
+
+
+def load_corpus(directory=CORPUS_DIR):
+    # CORPUS_DIR-ის ყველა .txt ფაილი ხდება კატეგორია; აბრუნებს ჩატვირთულ სახელებს
+    loaded = []
+    if not os.path.isdir(directory):
+        return loaded
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".txt"):
+            continue
+        source = os.path.join(directory, name)
+        cache = source[:-len(".txt")] + ".idx"
+        st = os.stat(source)
+        stamp = (st.st_mtime_ns, st.st_size)
+        index = WordIndex.load(cache, stamp)
+        if index is None:
+            index = WordIndex.build(read_word_file(source))
+            index.save(cache, stamp)
+        category = name[:-len(".txt")]
+        if not len(index):
+            # ფაილში არცერთი სწორი სიტყვა — კატეგორიად არ ჩანს, რომ თამაში არ ჩავარდეს
+            print(f"გაფრთხილება: {name} ცარიელია, გამოტოვებულია.")
+            continue
+        WORD_INDEXES[category] = index
+        WORD_CATEGORIES[category] = index.words
+        loaded.append(category)
+    return loaded
+
+
+def word_index(category):
+    index = WORD_INDEXES.get(category)
+    if index is None:
+        index = WORD_INDEXES[category] = WordIndex.build(WORD_CATEGORIES[category])
+    return index
+
+
 # ---------------------------
 #     დამხმარე ფუნქციები
 # ---------------------------
@@ -117,21 +433,27 @@ def choose_category():
 
         print("არასწორი არჩევანი, სცადეთ თავიდან.")
 
-def choose_word(category):
-    # შემთხვევითობის პრინციპით აირჩევს სიტყვას კატეგორიიდან
-    return random.choice(WORD_CATEGORIES[category])
+def choose_difficulty():
+    # სირთულის ზოლი ან None (ნებისმიერი)
+    print("\n--- აირჩიეთ სირთულე ---")
+    for i, band in enumerate(DIFFICULTY_BANDS, 1):
+        print(f"{i}. {band}")
+    print("0. ნებისმიერი")
 
+    while True:
+        choice = input("თქვენი არჩევანი: ").strip()
+        if choice == "0":
+            return None
 
-def mask_word(word, guessed_letters):
-    # აბრუნებს სიტყვას, სადაც ჩანს მხოლოდ გამოცნობილი ასოები, ხოლო უცნობი ჩანს როგორც - "_"
-    # (მაგ: "იპონი" + guessed = {'ი'} -> "ი _ _ _ ი")
-    displayed = []
-    for ch in word:
-        if ch.lower() in guessed_letters or not ch.isalpha():
-            displayed.append(ch)
-        else:
-            displayed.append("_")
-    return " ".join(displayed)
+        if choice.isdigit() and 1 <= int(choice) <= len(DIFFICULTY_BANDS):
+            return DIFFICULTY_BANDS[int(choice) - 1]
+
+        print("არასწორი არჩევანი, სცადეთ თავიდან.")
+
+def choose_word(category, difficulty=None):
+    # შემთხვევითობის პრინციპით აირჩევს სიტყვას კატეგორიიდან (და სირთულის ზოლიდან);
+    # სიტყვა არ განმეორდება, სანამ ზოლის ყველა სიტყვა არ გამოჩნდება
+    return word_index(category).draw(difficulty)
 
 def valid_input(s):
     # ვალიდაცია: არ იყოს ცარიელი; შედგება ანბანური სიმბოლოებისგან ან შეიცავს unicode სიმბოლოებს.
@@ -141,24 +463,22 @@ def valid_input(s):
 # ---------------------------
 #    მთავარი თამაშის ციკლი
 # ---------------------------
-def play_hangman(category):
-    word = choose_word(category)
-    word_lower = word.lower()
-    guessed_letters = set()
-    wrong_guesses = 0
-    tried_words = set()
+def play_hangman(category, difficulty=None):
+    # კონსოლის გარსი HangmanGame-ის თავზე: შეყვანა, ვალიდაცია და შეტყობინებები
+    game = HangmanGame(choose_word(category, difficulty))
+    word = game.word
 
     print("\n---- Hangman ----")
     print(f"სიტყვა აირჩევა შემთხვევით. მაქსიმალური შეცდომა: {MAX_ERRORS}\n")
 
     # თამაშის ციკლი (loop)
-    while True:
-        print(HANGMAN_PICS[wrong_guesses])
-        current_mask = mask_word(word, guessed_letters)
-        print("\nსიტყვა:", current_mask)
-        print(f"დარჩა {MAX_ERRORS - wrong_guesses} მცდელობა")
+    while not game.over:
+        print(HANGMAN_PICS[game.wrong])
+        print("\nსიტყვა:", game.mask())
+        print(f"დარჩა {game.attempts_left} მცდელობა")
+        guessed_letters = game.guessed_letters()
         if guessed_letters:
-            print("გამოცნობილი ასოები:", " ".join(sorted(guessed_letters)))
+            print("გამოცნობილი ასოები:", " ".join(guessed_letters))
         else:
             print("გამოცნობილი ასოები: —")
 
@@ -174,56 +494,205 @@ def play_hangman(category):
             continue
 
         guess = guess.lower()
+        result = game.guess(guess)
 
         # თუ მომხმარებელს შეყავს მთელ სიტყვა
         if len(guess) > 1:
-            if guess in tried_words:
+            if result == REPEAT:
                 print("ამ სიტყვის ცდა უკვე გაკეთდა.")
-                continue
-
-            tried_words.add(guess)
-            if guess == word_lower:
+            elif result == WON:
                 print("\n გამარჯვება! თქვენ სწორად გამოიცანით სიტყვა:", word)
-                break
             else:
-                wrong_guesses += 1
                 print("\nსიტყვა არასწორია.")
-                if wrong_guesses >= MAX_ERRORS:
-                    print(HANGMAN_PICS[wrong_guesses])
+                if result == LOST:
+                    print(HANGMAN_PICS[game.wrong])
                     print("\nGame over! სიტყვა იყო:", word)
-                    break
-                continue
-
-        # თუ ეს ერთი ასოა
-        letter = guess
-        if letter in guessed_letters:
-            print("გთხოვთ, არ გაიმეოროთ უკვე გამოცნობილი ასო:", letter)
             continue
 
-        # შემოწმება არის თუ არა სიტყვაში ასო
-        if letter in word_lower:
-            guessed_letters.add(letter)
+        # თუ ეს ერთი ასოა
+        if result == REPEAT:
+            print("გთხოვთ, არ გაიმეოროთ უკვე ნაცადი ასო:", guess)
+        elif result in (HIT, WON):
             print("ეს ასო არის სიტყვაში.")
-
             # თუ ყველა ასო მივიღეთ -> მოგება
-            all_letters_in_word = {ch for ch in word_lower if ch.isalpha()}
-            if all_letters_in_word.issubset(guessed_letters):
+            if result == WON:
                 print("\nთქვენ გამოიცანით მთელი სიტყვა:", word)
-                break
         else:
-            wrong_guesses += 1
             print("ეს ასობგერა არ არის სიტყვაში.")
-            if wrong_guesses >= MAX_ERRORS:
-                print(HANGMAN_PICS[wrong_guesses])
+            if result == LOST:
+                print(HANGMAN_PICS[game.wrong])
                 print("\nGame over! გამოსაცნობი სიტყვა იყო:", word)
-                break
 
     print("\n---- თამაში დასრულდა ----\n")
 
+# ---------------------------
+#       სერვერის რეჟიმი
+# ---------------------------
+class HangmanSession:
+    # ერთი მოთამაშის მდგომარეობა სერვერზე: მიმდინარე თამაში და სტატისტიკა.
+    # სიტყვების სიები და ინდექსები (WORD_INDEXES) ყველა სესიისთვის საერთოა
+    __slots__ = ("game", "category", "played", "won")
+
+    def __init__(self):
+        self.game = None
+        self.category = None
+        self.played = 0
+        self.won = 0
+
+    def state(self):
+        game = self.game
+        state = {"mask": game.mask(), "attempts": game.attempts_left,
+                 "guessed": "".join(game.guessed_letters()), "over": game.over}
+        if game.over:
+            state["won"] = game.won
+            state["word"] = game.word
+        return state
+
+    def handle(self, request):
+        # ერთი მოთხოვნა -> პასუხის ველები; შეცდომისას ValueError / KeyError
+        op = request["op"]
+        if op == "categories":
+            return {"categories": {name: len(words) for name, words in WORD_CATEGORIES.items()},
+                    "difficulties": list(DIFFICULTY_BANDS)}
+        if op == "new":
+            category = request["category"]
+            if category not in WORD_CATEGORIES:
+                raise ValueError(f"უცნობი კატეგორია: {category}")
+            difficulty = request.get("difficulty")
+            if difficulty is not None and difficulty not in DIFFICULTY_BANDS:
+                raise ValueError(f"უცნობი სირთულე: {difficulty}")
+            self.game = HangmanGame(choose_word(category, difficulty))
+            self.category = category
+            self.played += 1
+            return self.state()
+        if self.game is None:
+            raise ValueError("ჯერ დაიწყეთ თამაში (op: new).")
+        if op == "guess":
+            text = str(request["text"]).strip()
+            if not valid_input(text):
+                raise ValueError("შეიყვანეთ მხოლოდ ასოები.")
+            # უცნობი ასო ახალ ბიტს დაიკავებდა საერთო LETTER_BITS-ში — მოთამაშე
+            # მას ვერ გაზრდის; ასეთი ასო არცერთ ჩატვირთულ სიტყვაში არ გვხვდება
+            if len(text) == 1 and text.lower() not in LETTER_BITS:
+                raise ValueError(f"ასო '{text}' სიტყვის ანბანს არ ეკუთვნის.")
+            result = self.game.guess(text.lower())
+            if result == WON:
+                self.won += 1
+            return {"result": result, **self.state()}
+        if op == "state":
+            return self.state()
+        if op == "stats":
+            return {"played": self.played, "won": self.won}
+        raise ValueError(f"უცნობი ოპერაცია: {op}")
+
+
+async def handle_player(reader, writer, stats):
+    # ხაზით გამოყოფილი JSON; ერთი კავშირი = ერთი სესია, ცალკე ნაკადის გარეშე
+    session = HangmanSession()
+    stats["sessions"] += 1
+    stats["active"] += 1
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # ხაზი StreamReader-ის ლიმიტზე (64 KiB) გრძელია — მისი დარჩენილი
+                # ნაწილი შემდეგ მოთხოვნად წაიკითხებოდა, ამიტომ კავშირს ვხურავთ
+                response = {"ok": False, "error": "მოთხოვნა ზედმეტად გრძელია."}
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()
+                break
+            if not line:
+                break
+            try:
+                response = {"ok": True, **session.handle(json.loads(line))}
+            except KeyError as e:
+                response = {"ok": False, "error": f"აკლია ველი: {e}"}
+            except (ValueError, TypeError) as e:
+                response = {"ok": False, "error": str(e)}
+            writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        stats["active"] -= 1
+        writer.close()
+
+
+def raise_file_limit():
+    # ათასობით ერთდროული კავშირისთვის ღია ფაილების ლიმიტი მაქსიმუმამდე
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    # macOS-ზე hard ხშირად RLIM_INFINITY-ია, soft-ის მასზე აწევა კი ValueError-ია
+    target = 65536 if hard == resource.RLIM_INFINITY else hard
+    if soft != resource.RLIM_INFINITY and soft < target:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def serve(host="127.0.0.1", port=8766, socket_path=None, backlog=4096):
+    raise_file_limit()
+    stats = {"sessions": 0, "active": 0}
+
+    async def main():
+        def player(reader, writer):
+            return handle_player(reader, writer, stats)
+
+        if socket_path:
+            server = await asyncio.start_unix_server(player, socket_path, backlog=backlog)
+            print(f"სერვერი მუშაობს: {socket_path}")
+        else:
+            server = await asyncio.start_server(player, host, port, backlog=backlog)
+            print(f"სერვერი მუშაობს: {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print(f"სერვერი გაჩერდა. სულ სესიები: {stats['sessions']:,}")
+
+
 # ---------------------------
 #       მთავარი მენიუ
 # ---------------------------
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hangman (ქართულად)")
+    parser.add_argument("--simulate", type=int, metavar="N", help="N ავტომატური თამაში მენიუს გარეშე")
+    parser.add_argument("--category", help="სიმულაციის კატეგორია (ნაგულისხმევად ყველა)")
+    parser.add_argument("--shuffle", action="store_true", help="ასოების შემთხვევითი რიგი სიხშირის ნაცვლად")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--corpus", default=CORPUS_DIR, help="კატეგორიების .txt ფაილების საქაღალდე")
+    parser.add_argument("--serve", action="store_true", help="მრავალმოთამაშიანი JSON სერვერი")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--socket", help="Unix socket-ის გზა TCP-ის ნაცვლად")
+    args = parser.parse_args(argv)
+
+    load_corpus(args.corpus)
+    if args.category and args.category not in WORD_CATEGORIES:
+        parser.error(f"უცნობი კატეგორია: {args.category}")
+
+    if args.serve:
+        serve(args.host, args.port, args.socket)
+        return
+
+    if args.simulate:
+        if args.category:
+            words = WORD_CATEGORIES[args.category]
+        else:
+            words = [word for words in WORD_CATEGORIES.values() for word in words]
+        result = simulate(words, args.simulate, shuffle=args.shuffle, seed=args.seed)
+        seconds = result["seconds"] or 1e-9
+        print(f"თამაშები: {result['games']:,}, მოგება: {result['won'] / result['games']:.1%}, "
+              f"{result['games'] / seconds:,.0f} თამაში/წმ, {result['guesses'] / seconds:,.0f} სვლა/წმ")
+        return
+
     print("===== Hangman (ქართულად) ======")
     while True:
         print("\nმთავარი მენიუ:")
@@ -241,7 +710,8 @@ def main():
             if category is None:
                 continue
 
-            play_hangman(category)
+            difficulty = choose_difficulty()
+            play_hangman(category, difficulty)
 
             again = input("გსურთ კიდევ თამაში? (დ/ა): ").strip().lower()
             if again != "დ":
@@ -251,4 +721,5 @@ def main():
         else:
             print("არასწორი არჩევანი, სცადეთ თავიდან.")
 
-main()
+if __name__ == "__main__":
+    main()
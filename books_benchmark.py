@@ -0,0 +1,342 @@
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# BookManager-ის ოპერაციების ბენჩმარკი სინთეზურ ქართულ/ლათინურ კატალოგებზე.
+# შედეგები JSON-ად იწერება; --compare ძველ შედეგთან ადარებს და რეგრესიებს აჩვენებს
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+APP = os.path.join(HERE, "წიგნების მართვის კონსოლ აპლიკაცია.py")
+
+GEORGIAN_WORDS = ["ვეფხისტყაოსანი", "დათა", "თუთაშხია", "მთვარის", "მოტაცება", "ჯაყოს",
+                  "ხიზნები", "გველის", "პერანგი", "ქვაკაცი", "ბაში", "აჩუკი", "დიდოსტატის",
+                  "მარჯვენა", "ოთარაანთ", "ქვრივი", "კაცია", "ადამიანი", "განდეგილი", "ზღვა"]
+LATIN_WORDS = ["Solaris", "Dune", "Ulysses", "Time", "Light", "Night", "River", "Garden",
+               "Stone", "Winter", "Memory", "Empire", "Silence", "Machine", "Ocean"]
+GEORGIAN_NAMES = ["შოთა", "ილია", "აკაკი", "ვაჟა", "ნიკო", "ჭაბუა", "მიხეილ", "ნოდარ", "ოთარ"]
+GEORGIAN_SURNAMES = ["რუსთაველი", "ჭავჭავაძე", "წერეთელი", "ამირეჯიბი", "ჯავახიშვილი",
+                     "დუმბაძე", "ჭილაძე", "გამსახურდია", "ბარათაშვილი"]
+LATIN_NAMES = ["James", "Frank", "Ursula", "Stanislaw", "Virginia", "Italo", "Jorge"]
+LATIN_SURNAMES = ["Joyce", "Herbert", "Le Guin", "Lem", "Woolf", "Calvino", "Borges"]
+
+
+def load_app():
+    # მოდული ქართული სახელით — ჩვეულებრივი import-ით ვერ ჩაიტვირთება
+    spec = importlib.util.spec_from_file_location("books_app", APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_catalog(size, seed=1, latin_share=0.3):
+    # დეტერმინირებული კატალოგი: (სათაური, ავტორი, წელი)
+    rng = random.Random(seed)
+    rows = []
+    for n in range(size):
+        if rng.random() < latin_share:
+            words, author = LATIN_WORDS, f"{rng.choice(LATIN_NAMES)} {rng.choice(LATIN_SURNAMES)}"
+        else:
+            words = GEORGIAN_WORDS
+            author = f"{rng.choice(GEORGIAN_NAMES)} {rng.choice(GEORGIAN_SURNAMES)}"
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(1, 4))) + f" {n}"
+        rows.append((title, author, rng.randint(1800, 2024)))
+    return rows
+
+
+def make_queries(count, seed=1):
+    rng = random.Random(seed + 1)
+    words = GEORGIAN_WORDS + LATIN_WORDS
+    return [rng.choice(words)[:rng.randint(3, 8)] for _ in range(count)]
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ----- ოპერაციები -----
+# თითოეული ოპერაცია: setup(app, catalog, tmpdir) -> state, run(state) -> დამუშავებული ელემენტები
+
+def fresh_manager(app, catalog):
+    app.Book.next_id = 1
+    manager = app.BookManager()
+    manager.add_books(app.Book(*row) for row in catalog)
+    return manager
+
+
+def op_add_book(app, catalog, tmpdir):
+    app.Book.next_id = 1
+    books = [app.Book(*row) for row in catalog]
+    manager = app.BookManager()
+
+    def run():
+        for book in books:
+            manager.add_book(book)
+        return len(books)
+    return run
+
+
+def op_add_books(app, catalog, tmpdir):
+    app.Book.next_id = 1
+    books = [app.Book(*row) for row in catalog]
+    manager = app.BookManager()
+
+    def run():
+        manager.add_books(books)
+        return len(books)
+    return run
+
+
+def op_search_first(app, catalog, tmpdir):
+    # პირველი ძიება n-gram ინდექსსაც აგებს
+    manager = fresh_manager(app, catalog)
+
+    def run():
+        manager.search_by_title("მთვარის")
+        return 1
+    return run
+
+
+def op_search_by_title(app, catalog, tmpdir, queries=200):
+    manager = fresh_manager(app, catalog)
+    manager.search_by_title("x")
+    words = make_queries(queries)
+
+    def run():
+        for query in words:
+            manager.search_by_title(query)
+        return len(words)
+    return run
+
+
+def op_sort_books(app, catalog, tmpdir):
+    # დალაგების გადართვა + სრული სიის გავლა თითოეული გასაღებით
+    manager = fresh_manager(app, catalog)
+
+    def run():
+        for key in manager.SORT_KEYS:
+            manager.sort_books(key)
+            for _ in manager.iter_books():
+                pass
+        return len(catalog) * len(manager.SORT_KEYS)
+    return run
+
+
+def op_year_range(app, catalog, tmpdir, queries=200):
+    manager = fresh_manager(app, catalog)
+    rng = random.Random(3)
+    ranges = [(y, y + rng.randint(0, 20)) for y in (rng.randint(1800, 2024) for _ in range(queries))]
+
+    def run():
+        for start, end in ranges:
+            manager.find_by_year_range(start, end)
+        return len(ranges)
+    return run
+
+
+def op_fuzzy_search(app, catalog, tmpdir, queries=50):
+    manager = fresh_manager(app, catalog)
+    manager.fuzzy_search("x")
+    rng = random.Random(4)
+    words = []
+    for word in make_queries(queries):
+        pos = rng.randrange(len(word))
+        words.append(word[:pos] + word[pos + 1:])
+
+    def run():
+        for query in words:
+            manager.fuzzy_search(query)
+        return len(words)
+    return run
+
+
+def op_delete_book_by_id(app, catalog, tmpdir):
+    # შემთხვევითი 10%-ის წაშლა
+    manager = fresh_manager(app, catalog)
+    ids = [b.id for b in manager.iter_books()]
+    random.Random(5).shuffle(ids)
+    ids = ids[:max(1, len(ids) // 10)]
+
+    def run():
+        for book_id in ids:
+            manager.delete_book_by_id(book_id)
+        return len(ids)
+    return run
+
+
+def op_save_to_file(app, catalog, tmpdir):
+    manager = fresh_manager(app, catalog)
+    filename = os.path.join(tmpdir, "books.json")
+
+    def run():
+        manager.save_to_file(filename)
+        return len(catalog)
+    return run
+
+
+def op_load_from_file(app, catalog, tmpdir):
+    filename = os.path.join(tmpdir, "books.json")
+    fresh_manager(app, catalog).save_to_file(filename)
+    manager = app.BookManager()
+
+    def run():
+        manager.load_from_file(filename)
+        return len(catalog)
+    return run
+
+
+def op_save_trusted(app, catalog, tmpdir):
+    manager = fresh_manager(app, catalog)
+    filename = os.path.join(tmpdir, "books.jsonl")
+
+    def run():
+        manager.save_trusted(filename)
+        return len(catalog)
+    return run
+
+
+def op_load_trusted(app, catalog, tmpdir):
+    filename = os.path.join(tmpdir, "books.jsonl")
+    fresh_manager(app, catalog).save_trusted(filename)
+    manager = app.BookManager()
+
+    def run():
+        manager.load_trusted(filename)
+        return len(catalog)
+    return run
+
+
+OPERATIONS = {
+    "add_book": op_add_book,
+    "add_books": op_add_books,
+    "search_first": op_search_first,
+    "search_by_title": op_search_by_title,
+    "sort_books": op_sort_books,
+    "year_range": op_year_range,
+    "fuzzy_search": op_fuzzy_search,
+    "delete_book_by_id": op_delete_book_by_id,
+    "save_to_file": op_save_to_file,
+    "load_from_file": op_load_from_file,
+    "save_trusted": op_save_trusted,
+    "load_trusted": op_load_trusted,
+}
+
+
+def measure(app, name, catalog, repeat):
+    # დრო tracemalloc-ის გარეშე (ის ყველა ალოკაციას ანელებს), მეხსიერება — ცალკე გაშვებით
+    setup = OPERATIONS[name]
+    times = []
+    items = 0
+    with tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            run = setup(app, catalog, tmpdir)
+            start = time.perf_counter()
+            items = run()
+            times.append(time.perf_counter() - start)
+
+        run = setup(app, catalog, tmpdir)
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    best = min(times)
+    return {
+        "op": name,
+        "size": len(catalog),
+        "items": items,
+        "seconds_min": round(best, 6),
+        "seconds_median": round(statistics.median(times), 6),
+        "per_item_us": round(best / items * 1e6, 3) if items else None,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def compare(results, baseline, threshold):
+    # ოპერაცია/ზომის წყვილები, რომლებიც ბაზისზე threshold-ჯერ ნელია
+    previous = {(r["op"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        old = previous.get((r["op"], r["size"]))
+        if not old or not old["seconds_min"]:
+            continue
+        ratio = r["seconds_min"] / old["seconds_min"]
+        mark = "  <-- რეგრესია" if ratio > threshold else ""
+        print(f"{r['op']:<20} {r['size']:>9,}  {old['seconds_min']:>10.4f} -> "
+              f"{r['seconds_min']:>10.4f} წმ  x{ratio:.2f}{mark}", file=sys.stderr)
+        if ratio > threshold:
+            regressions.append(r)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BookManager-ის ბენჩმარკი")
+    parser.add_argument("--sizes", default="1000,10000",
+                        help="კატალოგის ზომები მძიმით, მაგ. 1000,10000,100000")
+    parser.add_argument("--ops", default=",".join(OPERATIONS),
+                        help="ოპერაციები მძიმით: " + ", ".join(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="გაშვებები თითო გაზომვაზე")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", "-o", help="შედეგების JSON ფაილი (ნაგულისხმევად stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="ძველი შედეგების JSON")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="რამდენჯერ ნელი ითვლება რეგრესიად --compare-ისას")
+    args = parser.parse_args(argv)
+
+    ops = [op.strip() for op in args.ops.split(",") if op.strip()]
+    unknown = [op for op in ops if op not in OPERATIONS]
+    if unknown:
+        parser.error(f"უცნობი ოპერაცია: {', '.join(unknown)}")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    app = load_app()
+    results = []
+    for size in sizes:
+        catalog = make_catalog(size, args.seed)
+        for op in ops:
+            result = measure(app, op, catalog, args.repeat)
+            print(f"{op:<20} {size:>9,}  {result['seconds_min']:>10.4f} წმ  "
+                  f"{result['peak_kb']:>10,.0f} KB", file=sys.stderr)
+            results.append(result)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+# წიგნების სერვერის (`serve` ბრძანება) დატვირთვის გენერატორი:
+# ბევრი ერთდროული კლიენტი, ოპერაციების ნარევი, გამტარუნარიანობა და p50/p99 დაყოვნება
+
+TITLE_WORDS = ["ვეფხისტყაოსანი", "დათა", "თუთაშხია", "მთვარის", "მოტაცება", "ჯაყოს",
+               "ხიზნები", "გველის", "პერანგი", "Solaris", "Dune", "Ulysses", "Time", "Light"]
+AUTHORS = ["შოთა რუსთაველი", "ჭაბუა ამირეჯიბი", "კონსტანტინე გამსახურდია",
+           "მიხეილ ჯავახიშვილი", "Stanislaw Lem", "Frank Herbert", "James Joyce"]
+
+# ოპერაცია -> წონა
+DEFAULT_MIX = {"search": 60, "list": 15, "get": 10, "add": 8, "edit": 5, "delete": 2}
+
+
+def random_title(rng):
+    return " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(1, 3)))
+
+
+def make_request(op, rng, known_ids):
+    if op == "search":
+        return {"op": "search", "query": rng.choice(TITLE_WORDS)[:rng.randint(3, 6)], "limit": 20}
+    if op == "list":
+        return {"op": "list", "sort": rng.choice([None, "title", "author", "year"]),
+                "offset": rng.randint(0, 200), "limit": 50}
+    if op == "add":
+        return {"op": "add", "title": random_title(rng), "author": rng.choice(AUTHORS),
+                "year": rng.randint(1800, 2024)}
+    book_id = rng.choice(known_ids) if known_ids else 1
+    if op == "get":
+        return {"op": "get", "id": book_id}
+    if op == "edit":
+        return {"op": "edit", "id": book_id, "year": rng.randint(1800, 2024)}
+    return {"op": "delete", "id": book_id}
+
+
+async def client(n, args, ops, weights, latencies, errors, known_ids, deadline):
+    rng = random.Random(args.seed + n)
+    if args.socket:
+        reader, writer = await asyncio.open_unix_connection(args.socket)
+    else:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    try:
+        while time.perf_counter() < deadline:
+            op = rng.choices(ops, weights)[0]
+            request = make_request(op, rng, known_ids)
+            start = time.perf_counter()
+            writer.write((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+            await writer.drain()
+            line = await reader.readline()
+            if not line:
+                break
+            latencies[op].append(time.perf_counter() - start)
+            response = json.loads(line)
+            if not response["ok"]:
+                errors[op] = errors.get(op, 0) + 1
+            elif op == "add":
+                known_ids.append(response["result"]["id"])
+            elif op == "search":
+                known_ids.extend(b["id"] for b in response["result"][:5])
+                del known_ids[:-10000]
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def report(latencies, errors, elapsed):
+    everything = [t for values in latencies.values() for t in values]
+    summary = {
+        "requests": len(everything),
+        "seconds": round(elapsed, 3),
+        "throughput": round(len(everything) / elapsed, 1) if elapsed else 0,
+        "p50_ms": round(percentile(everything, 50) * 1000, 3),
+        "p99_ms": round(percentile(everything, 99) * 1000, 3),
+        "errors": errors,
+        "operations": {
+            op: {"count": len(values),
+                 "p50_ms": round(percentile(values, 50) * 1000, 3),
+                 "p99_ms": round(percentile(values, 99) * 1000, 3)}
+            for op, values in latencies.items() if values
+        },
+    }
+    return summary
+
+
+async def run(args):
+    mix = dict(DEFAULT_MIX)
+    if args.read_only:
+        for op in ("add", "edit", "delete"):
+            mix.pop(op)
+    ops, weights = list(mix), list(mix.values())
+    latencies = {op: [] for op in ops}
+    errors = {}
+    known_ids = []
+    start = time.perf_counter()
+    deadline = start + args.duration
+    await asyncio.gather(*(client(n, args, ops, weights, latencies, errors, known_ids, deadline)
+                           for n in range(args.clients)))
+    return report(latencies, errors, time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="წიგნების სერვერის დატვირთვის ტესტი")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="Unix socket-ის გზა TCP-ის ნაცვლად")
+    parser.add_argument("--clients", type=int, default=50, help="ერთდროული კლიენტების რაოდენობა")
+    parser.add_argument("--duration", type=float, default=10.0, help="ხანგრძლივობა წამებში")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--read-only", action="store_true", help="მხოლოდ search/list/get")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run(args))
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
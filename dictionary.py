@@ -1,8 +1,25 @@
+import argparse
+import csv
 import json
+import mmap
 import os
+import re
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from heapq import merge
+
+from spelling import DeletionIndex, single_edits
 
 # JSON ლექსიკონის ფაილი
 DICTIONARY_FILE = "dictionary.json"
+# კომპილირებული (mmap) ლექსიკონი; იქმნება `python dictionary.py --compile`-ით
+COMPILED_FILE = "dictionary.bin"
 
 # თარგმნადი ენის წყვილები
 LANG_PAIRS = {
@@ -19,7 +36,7 @@ def pause():
 
 
 # ----------------------- JSON -----------------------
-def create_default_dictionary():
+def create_default_dictionary(filename=DICTIONARY_FILE):
     default_dict = {
         "ka-en": {"კატა": "cat", "ძაღლი": "dog"},
         "ka-ru": {"კატა": "кошка", "ძაღლი": "собака"},
@@ -27,21 +44,495 @@ def create_default_dictionary():
         "ru-ka": {"кошка": "კატა", "собака": "ძაღლი"},
     }
 
-    with open(DICTIONARY_FILE, "w", encoding="utf-8") as f:
-        json.dump(default_dict, f, ensure_ascii=False, indent=4)
+    save_dictionary(default_dict, filename)
 
-def load_dictionary():
-    if not os.path.exists(DICTIONARY_FILE):
-        print("ლექსიკონი ვერ მოიძებნა, იქმნება ახალი...")
-        create_default_dictionary()
-
-    with open(DICTIONARY_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+def save_dictionary(data, filename=DICTIONARY_FILE):
+    # ჯერ დროებით ფაილში, შემდეგ ატომური ჩანაცვლება — ნახევრად ჩაწერილი ფაილი არ რჩება
+    tmp = filename + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filename)
+
+
+# ----------------------- CHANGE LOG -----------------------
+class ChangeLog:
+    # დამატებული/შეცვლილი წყვილების ჟურნალი: თითო JSON ხაზი ჩანაწერზე,
+    # ყოველი ჩანაწერი ფაილის ბოლოში ემატება (O(1) I/O)
+    def __init__(self, filename, compact_every=1000):
+        self.filename = filename
+        self.compact_every = compact_every
+        self.records = 0
+        self.__file = None
+
+    def replay(self):
+        # აბრუნებს ჩანაწერებს; ავარიით გაწყვეტილი ბოლო ხაზი იჭრება
+        self.records = 0
+        try:
+            f = open(self.filename, "rb")
+        except FileNotFoundError:
+            return
+        good = 0
+        with f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                good += len(line)
+                self.records += 1
+                yield record
+            else:
+                return
+        with open(self.filename, "r+b") as f:
+            f.truncate(good)
+
+    def append(self, record):
+        if self.__file is None:
+            self.__file = open(self.filename, "ab")
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        self.__file.write(line.encode("utf-8"))
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.records += 1
+
+    def needs_compaction(self, dictionary_size=0):
+        # ჟურნალი იკუმშება, როცა ლექსიკონის ზომას გადააჭარბებს — snapshot-ის
+        # გადაწერის ღირებულება ასე ამორტიზებულად O(1) რჩება თითო დამატებაზე
+        return self.records >= max(self.compact_every, dictionary_size)
+
+    def truncate(self):
+        self.close()
+        with open(self.filename, "wb") as f:
+            os.fsync(f.fileno())
+        self.records = 0
+
+    def close(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+# ----------------------- COMPILED -----------------------
+# ბინარული ფორმატი (little-endian):
+#   სათაური: magic, წყარო JSON-ის (mtime_ns, ზომა), წყვილების რაოდენობა
+#   კატალოგი: თითო წყვილზე (სახელი, წყვილის ბლოკის offset, ჩანაწერების რაოდენობა)
+#   წყვილის ბლოკი: გასაღებების offset-ები (n+1), თარგმანების offset-ები (n+1),
+#                  UTF-8 ბაიტებით დალაგებული გასაღებები, შემდეგ თარგმანები
+COMPILED_MAGIC = b"KADICT01"
+COMPILED_HEADER = struct.Struct("<8sqqI")
+COMPILED_PAIR = struct.Struct("<16sQI")
+
+
+def compile_dictionary(data, filename=COMPILED_FILE, source_stamp=None):
+    mtime_ns, size = source_stamp or (0, 0)
+    pairs = sorted(data)
+    offset = COMPILED_HEADER.size + COMPILED_PAIR.size * len(pairs)
+    blocks = []
+    for name in pairs:
+        items = sorted((k.encode("utf-8"), v.encode("utf-8")) for k, v in data[name].items())
+        offset += -offset % 8
+        count = len(items)
+        key_offsets = array("Q")
+        value_offsets = array("Q")
+        pos = offset + 16 * (count + 1)
+        for blobs, offsets in (((k for k, _ in items), key_offsets),
+                               ((v for _, v in items), value_offsets)):
+            for blob in blobs:
+                offsets.append(pos)
+                pos += len(blob)
+            offsets.append(pos)
+        blocks.append((name, offset, items, key_offsets, value_offsets))
+        offset = pos
+
+    tmp = filename + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(COMPILED_HEADER.pack(COMPILED_MAGIC, mtime_ns, size, len(pairs)))
+        for name, block_offset, items, _, _ in blocks:
+            f.write(COMPILED_PAIR.pack(name.encode("utf-8"), block_offset, len(items)))
+        for _, block_offset, items, key_offsets, value_offsets in blocks:
+            f.write(b"\0" * (block_offset - f.tell()))
+            if sys.byteorder != "little":
+                key_offsets.byteswap()
+                value_offsets.byteswap()
+            key_offsets.tofile(f)
+            value_offsets.tofile(f)
+            f.writelines(k for k, _ in items)
+            f.writelines(v for _, v in items)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filename)
+
+
+class CompiledPair:
+    # ერთი ენის წყვილი mmap-ზე: ძიება ორობითია, ფაილი მთლიანად არ იკითხება
+    def __init__(self, mm, offset, count):
+        self.__mm = mm
+        end = offset + 8 * (count + 1)
+        self.__keys = memoryview(mm)[offset:end].cast("Q")
+        self.__values = memoryview(mm)[end:end + 8 * (count + 1)].cast("Q")
+        self.__count = count
+
+    def __len__(self):
+        return self.__count
+
+    def __key(self, i):
+        keys = self.__keys
+        return self.__mm[keys[i]:keys[i + 1]]
+
+    def __value(self, i):
+        values = self.__values
+        return self.__mm[values[i]:values[i + 1]].decode("utf-8")
+
+    def __find(self, word):
+        target = word.encode("utf-8")
+        i = bisect_left(range(self.__count), target, key=self.__key)
+        return i if i < self.__count and self.__key(i) == target else -1
+
+    def get(self, word, default=None):
+        i = self.__find(word)
+        return default if i < 0 else self.__value(i)
+
+    def __contains__(self, word):
+        return self.__find(word) >= 0
+
+    def __iter__(self):
+        for i in range(self.__count):
+            yield self.__key(i).decode("utf-8")
+
+    def items(self):
+        for i in range(self.__count):
+            yield self.__key(i).decode("utf-8"), self.__value(i)
+
+    def prefixed(self, prefix):
+        # გასაღებები მოცემული პრეფიქსით, დალაგებული რიგით
+        target = prefix.encode("utf-8")
+        i = bisect_left(range(self.__count), target, key=self.__key)
+        while i < self.__count:
+            key = self.__key(i)
+            if not key.startswith(target):
+                break
+            yield key.decode("utf-8")
+            i += 1
+
+    def release(self):
+        self.__keys.release()
+        self.__values.release()
+
+
+class CompiledDictionary:
+    # dict-ის მსგავსი ინტერფეისი: წყვილის სახელი -> CompiledPair
+    def __init__(self, filename=COMPILED_FILE):
+        if sys.byteorder != "little":
+            raise ValueError("კომპილირებული ლექსიკონი მხოლოდ little-endian სისტემებზე იკითხება.")
+        with open(filename, "rb") as f:
+            self.__mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, mtime_ns, size, count = COMPILED_HEADER.unpack_from(self.__mm)
+        if magic != COMPILED_MAGIC:
+            self.__mm.close()
+            raise ValueError(f"{filename}: უცნობი ფორმატი.")
+        self.source_stamp = (mtime_ns, size)
+        self.__pairs = {}
+        for n in range(count):
+            name, offset, entries = COMPILED_PAIR.unpack_from(
+                self.__mm, COMPILED_HEADER.size + n * COMPILED_PAIR.size)
+            self.__pairs[name.rstrip(b"\0").decode("utf-8")] = CompiledPair(self.__mm, offset, entries)
+
+    def __iter__(self):
+        return iter(self.__pairs)
+
+    def __contains__(self, pair_key):
+        return pair_key in self.__pairs
+
+    def __getitem__(self, pair_key):
+        return self.__pairs[pair_key]
+
+    def get(self, pair_key, default=None):
+        return self.__pairs.get(pair_key, default)
+
+    def close(self):
+        for pair in self.__pairs.values():
+            pair.release()
+        self.__pairs = {}
+        self.__mm.close()
+
+
+# ----------------------- SPELLING -----------------------
+# edit_distance, single_edits და DeletionIndex — spelling.py-ში (საერთოა წიგნების აპლიკაციასთან).
+# კომპილირებულ წყვილზე, რომელიც ამაზე დიდია, სრული წაშლების ინდექსი არ იგება: ის
+# მთელ mmap-ს წაიკითხავდა და თითო გასაღებზე ~29 ვარიანტს შექმნიდა. ასეთ წყვილში
+# მოთხოვნის ერთი ოპერაციის ვარიანტები (LANG_ALPHABETS-ით) ორობითი ძებნით მოწმდება
+SPELLING_INDEX_LIMIT = 100_000
+LANG_ALPHABETS = {
+    "ka": "აბგდევზთიკლმნოპჟრსტუფქღყშჩცძწჭხჯჰ",
+    "en": "abcdefghijklmnopqrstuvwxyz",
+    "ru": "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+}
 
 
-def save_dictionary(data):
-    with open(DICTIONARY_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
+# ----------------------- SERVICE -----------------------
+def prefixed(keys, prefix):
+    # დალაგებულ სიაში პრეფიქსის დიაპაზონი: O(|prefix| · log n + k)
+    i = bisect_left(keys, prefix)
+    while i < len(keys) and keys[i].startswith(prefix):
+        yield keys[i]
+        i += 1
+
+
+def file_stamp(filename):
+    try:
+        st = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class DictionaryService:
+    # ლექსიკონი იტვირთება ერთხელ და მეხსიერებაში რჩება; ფაილი ხელახლა იკითხება
+    # მხოლოდ მაშინ, როცა snapshot-ის, ჟურნალის ან კომპილირებული ფაილის mtime/ზომა
+    # გარედან შეიცვალა. თუ კომპილირებული ფაილი snapshot-ს შეესაბამება, JSON საერთოდ
+    # არ იპარსება — ძიება mmap-ზე ხდება. ახალი წყვილები ჟურნალში ემატება და
+    # მეხსიერებაში ფუძის თავზე დევს; snapshot მხოლოდ შეკუმშვისას გადაიწერება —
+    # როცა ჟურნალი ლექსიკონის ზომას გადააჭარბებს, ან მოთხოვნით (compact/compile)
+    def __init__(self, filename=DICTIONARY_FILE, compiled=COMPILED_FILE, compact_every=1000):
+        self.filename = filename
+        self.compiled = compiled
+        self.__log = ChangeLog(filename + ".log", compact_every)
+        # ფუძე: dict ან CompiledDictionary; ზედა ფენა: ჟურნალის ჩანაწერები
+        self.__base = None
+        # ფუძის ჩანაწერების რაოდენობა (ყველა წყვილში) — შეკუმშვის ზღვრისთვის
+        self.__base_size = 0
+        self.__overlay = {}
+        # პრეფიქსული ძიებისთვის დალაგებული გასაღებები: ფუძისა (მხოლოდ JSON რეჟიმში,
+        # იგება პირველ მოთხოვნაზე) და ზედა ფენისა (ნაზრდად ახლდება)
+        self.__sorted_base = {}
+        self.__sorted_overlay = {}
+        # "იქნებ გულისხმობდით" ინდექსები წყვილების მიხედვით; იგება პირველ
+        # suggest-ზე, შემდეგ ყოველ add-ზე ნაზრდად ახლდება
+        self.__spelling = {}
+        self.__stamp = None
+
+    def __stamps(self):
+        compiled = file_stamp(self.compiled) if self.compiled else None
+        return file_stamp(self.filename), file_stamp(self.__log.filename), compiled
+
+    def __close_base(self):
+        if isinstance(self.__base, CompiledDictionary):
+            self.__base.close()
+        self.__base = None
+        self.__sorted_base = {}
+
+    def __open_base(self, source_stamp):
+        if self.compiled and os.path.exists(self.compiled):
+            compiled = CompiledDictionary(self.compiled)
+            if compiled.source_stamp == source_stamp:
+                return compiled
+            compiled.close()
+        with open(self.filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def refresh(self):
+        # სამი os.stat — ფასი ფაილის ზომაზე არ არის დამოკიდებული
+        stamp = self.__stamps()
+        if stamp[0] is None:
+            print("ლექსიკონი ვერ მოიძებნა, იქმნება ახალი...")
+            create_default_dictionary(self.filename)
+            stamp = self.__stamps()
+        if stamp != self.__stamp:
+            self.__close_base()
+            self.__base = self.__open_base(stamp[0])
+            self.__base_size = sum(len(self.__base[pair]) for pair in self.__base)
+            overlay = {}
+            for record in self.__log.replay():
+                overlay.setdefault(record["pair"], {})
+                add_bidirectional(overlay, record["pair"], record["word"], record["translation"])
+            self.__overlay = overlay
+            self.__sorted_overlay = {pair: sorted(words) for pair, words in overlay.items()}
+            self.__spelling = {}
+            self.__stamp = self.__stamps()
+
+    @property
+    def is_compiled(self):
+        self.refresh()
+        return isinstance(self.__base, CompiledDictionary)
+
+    def lookup(self, pair_key, word):
+        self.refresh()
+        found = self.__overlay.get(pair_key, {}).get(word)
+        if found is None:
+            base = self.__base.get(pair_key)
+            if base is not None:
+                found = base.get(word)
+        return found
+
+    def complete(self, pair_key, prefix, limit=10):
+        # პირველი limit სიტყვა (ანბანური რიგით), რომელიც prefix-ით იწყება: [(სიტყვა, თარგმანი)]
+        self.refresh()
+        base = self.__base.get(pair_key)
+        if base is None:
+            found = iter(())
+        elif isinstance(base, CompiledPair):
+            found = base.prefixed(prefix)
+        else:
+            keys = self.__sorted_base.get(pair_key)
+            if keys is None:
+                keys = self.__sorted_base[pair_key] = sorted(base)
+            found = prefixed(keys, prefix)
+        found = merge(found, prefixed(self.__sorted_overlay.get(pair_key, []), prefix))
+
+        # თარგმანი იმავე ფუძიდან და ზედა ფენიდან — lookup() თითო სიტყვაზე refresh()-ს გაიმეორებდა
+        overlay = self.__overlay.get(pair_key, {})
+        result = []
+        last = None
+        for word in found:
+            if word != last:
+                translation = overlay.get(word)
+                if translation is None:
+                    translation = base.get(word)
+                result.append((word, translation))
+                last = word
+                if len(result) >= limit:
+                    break
+        return result
+
+    def suggest(self, pair_key, word, max_distance=2, limit=5):
+        # მსგავსი არსებული სიტყვები (რედაქტირების მანძილი <= max_distance):
+        # [(სიტყვა, თარგმანი)], ჯერ უახლოესი. დიდ კომპილირებულ წყვილში ფუძიდან
+        # მხოლოდ 1 მანძილის სიტყვები მოიძებნება (იხ. SPELLING_INDEX_LIMIT)
+        self.refresh()
+        base = self.__base.get(pair_key)
+        overlay = self.__overlay.get(pair_key, {})
+        probe = isinstance(base, CompiledPair) and len(base) > SPELLING_INDEX_LIMIT
+        index = self.__spelling.get(pair_key)
+        if index is None:
+            index = self.__spelling[pair_key] = DeletionIndex()
+            if base is not None and not probe:
+                for key in base:
+                    index.add(key)
+            for key in overlay:
+                index.add(key)
+
+        found = {candidate: d for d, candidate, _ in index.search(word, max_distance)}
+        if probe and max_distance >= 1:
+            alphabet = set(LANG_ALPHABETS.get(pair_key.split("-")[0], "")) | set(word)
+            for candidate in single_edits(word, alphabet):
+                if candidate not in found and candidate in base:
+                    found[candidate] = 1
+
+        result = []
+        for _, candidate in sorted((d, candidate) for candidate, d in found.items())[:limit]:
+            translation = overlay.get(candidate)
+            if translation is None:
+                translation = base.get(candidate)
+            result.append((candidate, translation))
+        return result
+
+    def __track(self, pair_key, word):
+        keys = self.__sorted_overlay.setdefault(pair_key, [])
+        i = bisect_left(keys, word)
+        if i == len(keys) or keys[i] != word:
+            keys.insert(i, word)
+            index = self.__spelling.get(pair_key)
+            if index is not None:
+                index.add(word)
+
+    def add(self, pair_key, word, translation):
+        self.refresh()
+        self.__overlay.setdefault(pair_key, {})
+        add_bidirectional(self.__overlay, pair_key, word, translation)
+        from_lang, to_lang = pair_key.split("-")
+        self.__track(pair_key, word)
+        self.__track(f"{to_lang}-{from_lang}", translation)
+        self.__log.append({"pair": pair_key, "word": word, "translation": translation})
+        if self.__log.needs_compaction(self.__base_size):
+            self.compact()
+        # საკუთარი ჩაწერა ხელახალ ჩატვირთვას არ იწვევს
+        self.__stamp = self.__stamps()
+
+    def snapshot(self):
+        # მთლიანი ლექსიკონი ჩვეულებრივ dict-ებად (ფუძე + ჟურნალი) — O(n)
+        self.refresh()
+        data = {pair: dict(self.__base[pair].items()) for pair in self.__base}
+        for pair, words in self.__overlay.items():
+            data.setdefault(pair, {}).update(words)
+        return data
+
+    def import_pairs(self, pair_key, rows, overwrite=False):
+        # მასობრივი დამატება: ერთი გავლა ჰეშ-ინდექსებზე (პირდაპირი და საპირისპირო
+        # წყვილი), შემდეგ ერთი ატომური snapshot — ჟურნალში თითოეული წყვილი არ იწერება.
+        # rows: (ხაზი, სიტყვა, თარგმანი); კონფლიქტები overwrite-ის გარეშე გამოიტოვება
+        from_lang, to_lang = pair_key.split("-")
+        reverse_key = f"{to_lang}-{from_lang}"
+        data = self.snapshot()
+        forward = data.setdefault(pair_key, {})
+        reverse = data.setdefault(reverse_key, {})
+        added = existing = 0
+        conflicts = []
+        for line_no, word, translation in rows:
+            current = forward.get(word)
+            owner = reverse.get(translation)
+            if current == translation and owner == word:
+                existing += 1
+                continue
+            if not overwrite:
+                if current is not None and current != translation:
+                    conflicts.append((line_no, word, translation,
+                                      f"სიტყვას უკვე აქვს თარგმანი: {current}"))
+                    continue
+                if owner is not None and owner != word:
+                    conflicts.append((line_no, word, translation,
+                                      f"თარგმანი უკვე ეკუთვნის სიტყვას: {owner}"))
+                    continue
+            forward[word] = translation
+            reverse[translation] = word
+            added += 1
+
+        if added:
+            self.__write(isinstance(self.__base, CompiledDictionary), data)
+            self.__spelling = {}
+        return {"added": added, "existing": existing, "conflicts": conflicts}
+
+    def __write(self, compile_base, data=None):
+        # ახალი snapshot ატომურად ანაცვლებს ძველს, შემდეგ ჟურნალი სუფთავდება;
+        # ავარია ამ ორს შორის უვნებელია — ჟურნალის ხელახალი გამოყენება იდემპოტენტურია
+        changed = data is not None or self.__log.records
+        if data is None:
+            data = self.snapshot()
+        # Windows-ზე mmap-ით გახსნილ ფაილს os.replace ვერ ანაცვლებს — ძველი ფუძე
+        # ჩაწერამდე იხურება; შეცდომისას სერვისი snapshot-ის dict-ით აგრძელებს
+        self.__close_base()
+        self.__base = data
+        if changed or not os.path.exists(self.filename):
+            save_dictionary(data, self.filename)
+        if compile_base:
+            compile_dictionary(data, self.compiled, file_stamp(self.filename))
+        self.__log.truncate()
+        self.__base = CompiledDictionary(self.compiled) if compile_base else data
+        self.__base_size = sum(len(words) for words in data.values())
+        self.__overlay = {}
+        self.__sorted_overlay = {}
+        self.__stamp = self.__stamps()
+
+    def compact(self):
+        if self.__base is None or not self.__log.records:
+            return
+        self.__write(isinstance(self.__base, CompiledDictionary))
+
+    def compile(self):
+        # JSON (+ ჟურნალი) -> კომპილირებული ფაილი; შემდგომი გაშვებები JSON-ს აღარ პარსავენ
+        if not self.compiled:
+            raise ValueError("კომპილირებული ფაილის სახელი მითითებული არ არის.")
+        self.__write(True)
+
+    def close(self):
+        # ჟურნალი დისკზე რჩება და შემდეგ გაშვებაზე აღდგება — გასვლისას snapshot-ს
+        # ხელახლა არ ვწერთ
+        self.__log.close()
+        self.__close_base()
+        self.__stamp = None
 
 
 # ----------------------- LOGIC -----------------------
@@ -57,8 +548,7 @@ def add_bidirectional(dictionary, pair_key, word, translation):
 
     dictionary[reverse_key][translation] = word
 
-def translate():
-    dictionary = load_dictionary()
+def translate(service):
 
     print("========== თარგმანი ==========\n")
     print("აირჩიე თარგმნის მიმართულება:")
@@ -80,9 +570,6 @@ def translate():
     from_lang, to_lang, label = LANG_PAIRS[choice]
     pair_key = f"{from_lang}-{to_lang}"
 
-    if pair_key not in dictionary:
-        dictionary[pair_key] = {}
-
     print(f"არჩეული მიმართულება: {label}")
     print("შეიყვანე სიტყვა (0 - გამოსვლა)\n")
 
@@ -92,15 +579,27 @@ def translate():
         return
 
     # თუ სიტყვა უკვე არსებობს
-    if word in dictionary[pair_key]:
+    found = service.lookup(pair_key, word)
+    if found is not None:
         print("======== შედეგი =========")
-        print(f"თარგმანი: {dictionary[pair_key][word]}")
+        print(f"თარგმანი: {found}")
         print("="*25)
         pause()
         return
 
-    # თუ არ არის - ვთავაზობთ დამატებას
+    # თუ არ არის - ვაჩვენებთ მსგავს და ამ პრეფიქსით დაწყებულ სიტყვებს და ვთავაზობთ დამატებას
     print("\n!!! სიტყვა ლექსიკონში ვერ მოიძებნა.")
+    similar = service.suggest(pair_key, word)
+    if similar:
+        print("იქნებ გულისხმობდით:")
+        for found, translation in similar:
+            print(f"  {found} — {translation}")
+    shown = {found for found, _ in similar}
+    suggestions = [s for s in service.complete(pair_key, word, 5 + len(shown)) if s[0] not in shown][:5]
+    if suggestions:
+        print("ამით იწყება:")
+        for found, translation in suggestions:
+            print(f"  {found} — {translation}")
     add = input("გსურთ დამატება? (y/n, 0 - გამოსვლა): ")
 
     if add == "0":
@@ -115,14 +614,235 @@ def translate():
     if translation == "0":
         return
 
-    add_bidirectional(dictionary, pair_key, word, translation)
-    save_dictionary(dictionary)
+    service.add(pair_key, word, translation)
 
     print("\nსიტყვა წარმატებით დაემატა ორმხრივად!")
     pause()
 
+# ----------------------- BATCH -----------------------
+# სიტყვა = ასოების მიმდევრობა ნებისმიერ დამწერლობაში (ქართული, ლათინური, კირილიცა)
+WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+# ProcessPool-ის თითოეულ პროცესში ერთხელ ჩატვირთული ლექსიკონი
+_worker_service = None
+
+
+def resolve_pair(pair):
+    # მენიუს ნომერი ("1") ან წყვილის სახელი ("ka-en") -> "ka-en"
+    if pair in LANG_PAIRS:
+        from_lang, to_lang, _ = LANG_PAIRS[pair]
+        return f"{from_lang}-{to_lang}"
+    if pair in {f"{f}-{t}" for f, t, _ in LANG_PAIRS.values()}:
+        return pair
+    raise ValueError(f"უცნობი მიმართულება: {pair}")
+
+
+def translate_text(service, pair_key, text):
+    # აბრუნებს (თარგმნილი ტექსტი, {უცნობი სიტყვა: რაოდენობა}); სიტყვებს შორის
+    # ყველაფერი (სივრცეები, პუნქტუაცია, ციფრები) უცვლელად რჩება
+    cache = {}
+    unknown = Counter()
+
+    def replace(match):
+        token = match.group()
+        word = token.lower()
+        if word not in cache:
+            cache[word] = service.lookup(pair_key, word)
+        translation = cache[word]
+        if translation is None:
+            unknown[word] += 1
+            return token
+        # მხედრული ერთრეგისტრიანია — ქართულ თარგმანს მთავრულით არ ვიწყებთ
+        if token[0].isupper() and not "\u10d0" <= translation[:1] <= "\u10ff":
+            return translation[:1].upper() + translation[1:]
+        return translation
+
+    return WORD_PATTERN.sub(replace, text), unknown
+
+
+def init_worker(filename, compiled):
+    global _worker_service
+    _worker_service = DictionaryService(filename, compiled)
+    _worker_service.refresh()
+
+
+def translate_chunk(pair_key, text):
+    return translate_text(_worker_service, pair_key, text)
+
+
+def read_chunks(stream, chunk_size):
+    # სტრიქონების საზღვარზე დაჭრილი ნაწილები — სიტყვა ორ ნაწილად არ იყოფა
+    lines = []
+    size = 0
+    for line in stream:
+        lines.append(line)
+        size += len(line)
+        if size >= chunk_size:
+            yield "".join(lines)
+            lines = []
+            size = 0
+    if lines:
+        yield "".join(lines)
+
+
+def translate_stream(service, pair_key, source, target, workers=None, chunk_size=1 << 20):
+    # ნაკადური თარგმნა; ერთდროულად მაქსიმუმ 2×workers ნაწილია მეხსიერებაში,
+    # შედეგები კი შესვლის რიგით იწერება
+    workers = workers or os.cpu_count() or 1
+    unknown = Counter()
+    chunks = read_chunks(source, chunk_size)
+
+    if workers == 1:
+        for chunk in chunks:
+            text, missing = translate_text(service, pair_key, chunk)
+            target.write(text)
+            unknown.update(missing)
+        return unknown
+
+    with ProcessPoolExecutor(workers, initializer=init_worker,
+                             initargs=(service.filename, service.compiled)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(translate_chunk, pair_key, chunk))
+            if len(pending) >= 2 * workers:
+                text, missing = pending.popleft().result()
+                target.write(text)
+                unknown.update(missing)
+        while pending:
+            text, missing = pending.popleft().result()
+            target.write(text)
+            unknown.update(missing)
+    return unknown
+
+
+def batch_translate(service, pair, source="-", target="-", unknown_file=None,
+                    workers=None, chunk_size=1 << 20):
+    pair_key = resolve_pair(pair)
+    # მთავარი პროცესი ლექსიკონს (და ჟურნალს) ერთხელ ამზადებს, სანამ პროცესები ჩაირთვება;
+    # სტატუსის შეტყობინებები stderr-ში მიდის, რომ stdout-ში თარგმანს არ აერიოს
+    with redirect_stdout(sys.stderr):
+        service.refresh()
+        service.compact()
+
+    start = time.perf_counter()
+    src = sys.stdin if source == "-" else open(source, "r", encoding="utf-8", newline="")
+    dst = sys.stdout if target == "-" else open(target, "w", encoding="utf-8", newline="")
+    try:
+        unknown = translate_stream(service, pair_key, src, dst, workers, chunk_size)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    if unknown_file:
+        with open(unknown_file, "w", encoding="utf-8") as f:
+            for word, count in unknown.most_common():
+                f.write(f"{word}\t{count}\n")
+
+    elapsed = time.perf_counter() - start
+    print(f"უცნობი სიტყვები: {len(unknown):,} ({sum(unknown.values()):,} შემთხვევა), "
+          f"{elapsed:.2f} წმ.", file=sys.stderr)
+    return unknown
+
+
+# ----------------------- IMPORT -----------------------
+WORD_LIST_HEADERS = (["word", "translation"], ["სიტყვა", "თარგმანი"])
+
+
+def read_word_list(filename, rejected):
+    # ნაკადურად კითხულობს (ხაზი, სიტყვა, თარგმანი) წყვილებს TSV ან CSV ფაილიდან;
+    # სათაურის ხაზი, ცარიელი და '#'-ით დაწყებული ხაზები გამოიტოვება,
+    # არასწორი — rejected-ში ემატება
+    delimiter = "," if filename.lower().endswith(".csv") else "\t"
+    with open(filename, "r", encoding="utf-8-sig", newline="") as f:
+        for line_no, row in enumerate(csv.reader(f, delimiter=delimiter), start=1):
+            if not row or not "".join(row).strip() or row[0].lstrip().startswith("#"):
+                continue
+            if line_no == 1 and [c.strip().lower() for c in row] in WORD_LIST_HEADERS:
+                continue
+            if len(row) != 2:
+                rejected.append((line_no, ",".join(row), "", "მოსალოდნელია ორი სვეტი"))
+                continue
+            word, translation = row[0].strip().lower(), row[1].strip().lower()
+            if not word or not translation:
+                rejected.append((line_no, word, translation, "ცარიელი ველი"))
+                continue
+            yield line_no, word, translation
+
+
+def import_word_list(service, pair, filename, overwrite=False, report=None):
+    pair_key = resolve_pair(pair)
+    start = time.perf_counter()
+    rejected = []
+    summary = service.import_pairs(pair_key, read_word_list(filename, rejected), overwrite)
+    rejected.extend(summary.pop("conflicts"))
+    rejected.sort()
+    summary["rejected"] = len(rejected)
+    summary["seconds"] = time.perf_counter() - start
+
+    if report:
+        with open(report, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["line", "word", "translation", "reason"])
+            writer.writerows(rejected)
+    else:
+        for line_no, word, translation, reason in rejected[:20]:
+            print(f"  ხაზი {line_no}: {word} → {translation}: {reason}")
+
+    print(f"დამატებულია {summary['added']:,}, უკვე არსებობდა {summary['existing']:,}, "
+          f"უარყოფილია {summary['rejected']:,} ({summary['seconds']:.2f} წმ).")
+    return summary
+
+
 # ----------------------- MAIN -----------------------
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ლექსიკონი")
+    parser.add_argument("--compile", action="store_true",
+                        help="ლექსიკონის კომპილაცია ბინარულ ფაილში სწრაფი გაშვებისთვის")
+    parser.add_argument("--batch", metavar="PAIR",
+                        help="ტექსტის არაინტერაქტიული თარგმნა: ka-en, ka-ru, en-ka, ru-ka ან მენიუს ნომერი")
+    parser.add_argument("--import", dest="import_file", metavar="FILE",
+                        help="TSV/CSV სიტყვების სიის მასობრივი იმპორტი (--pair-ით)")
+    parser.add_argument("--pair", help="იმპორტის მიმართულება: ka-en, ka-ru, en-ka, ru-ka ან მენიუს ნომერი")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="კონფლიქტისას არსებული თარგმანის გადაწერა")
+    parser.add_argument("--report", help="უარყოფილი სტრიქონების CSV ანგარიში")
+    parser.add_argument("--input", default="-", help="შესატანი ფაილი (ნაგულისხმევად stdin)")
+    parser.add_argument("--output", default="-", help="შედეგის ფაილი (ნაგულისხმევად stdout)")
+    parser.add_argument("--unknown", help="უცნობი სიტყვების სია (სიტყვა<TAB>რაოდენობა)")
+    parser.add_argument("--workers", type=int, default=None, help="პროცესების რაოდენობა")
+    parser.add_argument("--chunk-size", type=int, default=1 << 20, help="ნაწილის ზომა სიმბოლოებში")
+    args = parser.parse_args(argv)
+
+    service = DictionaryService()
+    if args.compile:
+        service.compile()
+        service.close()
+        print(f"კომპილირებულია: {service.compiled}")
+        return
+
+    if args.import_file:
+        if not args.pair:
+            parser.error("--import მოითხოვს --pair-ს.")
+        try:
+            import_word_list(service, args.pair, args.import_file, args.overwrite, args.report)
+        except ValueError as e:
+            parser.error(str(e))
+        finally:
+            service.close()
+        return
+
+    if args.batch:
+        try:
+            batch_translate(service, args.batch, args.input, args.output, args.unknown,
+                            args.workers, args.chunk_size)
+        except ValueError as e:
+            parser.error(str(e))
+        finally:
+            service.close()
+        return
+
     while True:
         print("=========== მენიუ ==========")
         print("1. თარგმნა")
@@ -132,13 +852,15 @@ def main():
         choice = input("აირჩიე: ")
 
         if choice == "1":
-            translate()
+            translate(service)
         elif choice == "0":
+            service.close()
             print("პროგრამა დასრულდა.")
             break
         else:
             print("!!! არასწორი არჩევანი!")
             pause()
 
-main()
+if __name__ == "__main__":
+    main()
 
@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from Hangman import WORD_CATEGORIES, LETTERS, frequency_order, raise_file_limit
+
+# Hangman სერვერის (`Hangman.py --serve`) დატვირთვის ტესტი: ათასობით ერთდროული
+# სესია, თითოეული თამაშობს თამაშს თამაშის მიყოლებით; ითვლის დასრულებულ
+# თამაშებს წამში და თითო სვლის დაყოვნების p50/p90/p99-ს
+
+
+def guess_order(shuffle, rng):
+    # სიხშირის რიგი ჩაშენებული კატეგორიებიდან + დანარჩენი ასოები ბოლოში
+    order = frequency_order(word for words in WORD_CATEGORIES.values() for word in words)
+    order += [ch for ch in LETTERS if ch not in order]
+    if shuffle:
+        rng.shuffle(order)
+    return order
+
+
+async def connect(args):
+    if args.socket:
+        return await asyncio.open_unix_connection(args.socket)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def request(reader, writer, message):
+    writer.write((json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8"))
+    await writer.drain()
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("სერვერმა კავშირი დახურა")
+    return json.loads(line)
+
+
+async def player(n, args, categories, stats, clock, connect_limit):
+    rng = random.Random(args.seed + n)
+    try:
+        # კავშირები ნაწილ-ნაწილ იხსნება, რომ listen-ის რიგი არ გადაივსოს
+        async with connect_limit:
+            reader, writer = await connect(args)
+    except OSError:
+        stats["errors"]["connect"] = stats["errors"].get("connect", 0) + 1
+        return
+    stats["connected"] += 1
+    try:
+        # ყველა სესია ჯერ უერთდება, შემდეგ ერთად იწყებს თამაშს
+        await clock["start"].wait()
+        while time.perf_counter() < clock["deadline"]:
+            response = await request(reader, writer, {"op": "new", "category": rng.choice(categories),
+                                                      "difficulty": args.difficulty})
+            if not response["ok"]:
+                stats["errors"][response["error"]] = stats["errors"].get(response["error"], 0) + 1
+                break
+            for letter in guess_order(args.shuffle, rng):
+                start = time.perf_counter()
+                response = await request(reader, writer, {"op": "guess", "text": letter})
+                stats["latencies"].append(time.perf_counter() - start)
+                if not response["ok"]:
+                    stats["errors"][response["error"]] = stats["errors"].get(response["error"], 0) + 1
+                    return
+                if response["over"]:
+                    stats["games"] += 1
+                    stats["won"] += response["won"]
+                    break
+                if args.think:
+                    await asyncio.sleep(rng.uniform(0, args.think))
+    except ConnectionError:
+        stats["errors"]["disconnect"] = stats["errors"].get("disconnect", 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(values, p):
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def run(args):
+    reader, writer = await connect(args)
+    response = await request(reader, writer, {"op": "categories"})
+    writer.close()
+    categories = args.category or list(response["categories"])
+
+    stats = {"connected": 0, "games": 0, "won": 0, "errors": {}, "latencies": []}
+    clock = {"start": asyncio.Event(), "deadline": 0.0}
+    connect_limit = asyncio.Semaphore(args.connect_rate)
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(player(n, args, categories, stats, clock, connect_limit))
+             for n in range(args.sessions)]
+    while stats["connected"] + stats["errors"].get("connect", 0) < args.sessions:
+        await asyncio.sleep(0.01)
+    connect_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clock["deadline"] = start + args.duration
+    clock["start"].set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(stats["latencies"])
+    return {
+        "sessions": args.sessions,
+        "connected": stats["connected"],
+        "connect_seconds": round(connect_seconds, 3),
+        "sessions_per_second": round(stats["connected"] / connect_seconds, 1) if connect_seconds else 0,
+        "seconds": round(elapsed, 3),
+        "games": stats["games"],
+        "games_per_second": round(stats["games"] / elapsed, 1) if elapsed else 0,
+        "win_rate": round(stats["won"] / stats["games"], 4) if stats["games"] else 0,
+        "guesses": len(latencies),
+        "guesses_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "errors": stats["errors"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hangman სერვერის დატვირთვის ტესტი")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--socket", help="Unix socket-ის გზა TCP-ის ნაცვლად")
+    parser.add_argument("--sessions", type=int, default=1000, help="ერთდროული სესიების რაოდენობა")
+    parser.add_argument("--duration", type=float, default=10.0, help="თამაშის ხანგრძლივობა წამებში")
+    parser.add_argument("--connect-rate", type=int, default=500,
+                        help="ერთდროულად გახსნილი კავშირების მაქსიმუმი შეერთებისას")
+    parser.add_argument("--category", action="append", help="კატეგორია (ნაგულისხმევად სერვერის ყველა)")
+    parser.add_argument("--difficulty", help="სირთულე (მარტივი / საშუალო / რთული)")
+    parser.add_argument("--shuffle", action="store_true", help="ასოების შემთხვევითი რიგი")
+    parser.add_argument("--think", type=float, default=0.0,
+                        help="მაქს. პაუზა სვლებს შორის წამებში (ადამიანის იმიტაცია)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    raise_file_limit()
+    summary = asyncio.run(run(args))
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
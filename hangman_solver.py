@@ -0,0 +1,222 @@
+import argparse
+import json
+import time
+
+import numpy as np
+
+from Hangman import (WORD_CATEGORIES, MAX_ERRORS, LETTERS, WON, LOST,
+                     HangmanGame, letter_bit, frequency_order)
+
+# Hangman-ის ავტომატური ამომხსნელი: ყოველ სვლაზე ირჩევს ასოს, რომლის გახსნის
+# შაბლონიც დარჩენილ კანდიდატებს ყველაზე თანაბრად ყოფს (მაქსიმალური ენტროპია)
+
+
+def skeleton(word):
+    # სიტყვის "ჩონჩხი": ასოები -> "_", დანარჩენი (მაგ. "-") უცვლელად — მოთამაშე მას თავიდანვე ხედავს
+    return "".join("_" if ch.isalpha() else ch for ch in word.lower())
+
+
+class WordMatrix:
+    # კანდიდატი სიტყვები ჩონჩხის (სიგრძე + არა-ასოების მდებარეობა) მიხედვით
+    # დაჯგუფებული NumPy მატრიცებად: ასო -> მისი ინდექსი LETTERS-ში,
+    # არა-ასო -> letters (ცალკე სვეტი, რომელიც არასდროს ირჩევა)
+    def __init__(self, words):
+        groups = {}
+        for word in dict.fromkeys(w.lower() for w in words):
+            groups.setdefault(skeleton(word), []).append(word)
+        # ჯერ ყველა ასო იღებს ბიტს, რომ ანბანის ზომა ცნობილი იყოს
+        self.fallback = frequency_order(word for group in groups.values() for word in group)
+        self.letters = nonletter = len(LETTERS)
+        self.words = groups
+        self.matrices = {
+            key: np.array([[letter_bit(ch).bit_length() - 1 if ch.isalpha() else nonletter
+                            for ch in word] for word in group],
+                          dtype=np.uint16).reshape(len(group), len(key))
+            for key, group in groups.items()
+        }
+
+    def __len__(self):
+        return sum(len(group) for group in self.words.values())
+
+
+def position_weights(length):
+    # გახსნის შაბლონი = პოზიციების ბიტური ნიღაბი; 64-ზე გრძელი სიტყვებისთვის — ჰეში
+    if length <= 64:
+        return np.left_shift(np.uint64(1), np.arange(length, dtype=np.uint64))
+    return np.random.default_rng(0).integers(1, 2 ** 63, size=length, dtype=np.uint64)
+
+
+def reveal_patterns(matrix, letters, weights):
+    # ყველა კანდიდატისა და ყველა ასოს გახსნის შაბლონი ერთ ვექტორულ გავლაში:
+    # patterns[i, c] = იმ პოზიციების ნიღაბი, სადაც i-ურ სიტყვაში c ასოა. O(n · სიგრძე)
+    n, length = matrix.shape
+    patterns = np.zeros((n, letters + 1), dtype=np.uint64)
+    rows = np.arange(n)
+    for pos in range(length):
+        patterns[rows, matrix[:, pos]] += weights[pos]
+    return patterns[:, :letters]
+
+
+def partition_entropy(patterns):
+    # თითოეული სვეტისთვის (ასოსთვის) შაბლონებით დაყოფის ენტროპია ბიტებში:
+    # H = log2(n) - Σ c·log2(c) / n, სადაც c — ერთი შაბლონის მქონე კანდიდატების რაოდენობა.
+    # სვეტები ცალ-ცალკე ლაგდება, ჯგუფები კი ერთნაირი მნიშვნელობების სერიებია
+    n, k = patterns.shape
+    ordered = np.sort(patterns.T, axis=1).ravel()
+    starts = np.empty(n * k, dtype=bool)
+    starts[0] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=starts[1:])
+    starts[::n] = True
+    first = np.flatnonzero(starts)
+    runs = np.diff(first, append=n * k).astype(np.float64)
+    weighted = np.bincount(first // n, weights=runs * np.log2(runs), minlength=k)
+    return np.log2(n) - weighted / n
+
+
+class EntropySolver:
+    def __init__(self, matrix: WordMatrix):
+        self.matrix = matrix
+        self.__weights = {}
+
+    def start(self, word_skeleton):
+        # ახალი თამაში: კანდიდატები — იგივე ჩონჩხის სიტყვები
+        self.skeleton = word_skeleton
+        matrix = self.matrix.matrices.get(word_skeleton)
+        self.codes = matrix if matrix is not None else np.zeros((0, len(word_skeleton)), np.uint16)
+        self.candidates = np.arange(len(self.codes))
+        self.tried = np.zeros(self.matrix.letters, dtype=bool)
+        self.tried_words = set()
+        self.__patterns = None
+        weights = self.__weights.get(len(word_skeleton))
+        if weights is None:
+            weights = self.__weights[len(word_skeleton)] = position_weights(len(word_skeleton))
+        self.weights = weights
+
+    def choose(self):
+        # აბრუნებს ასოს ან — როცა ერთი კანდიდატიღა დარჩა — მთელ სიტყვას
+        words = self.matrix.words.get(self.skeleton, [])
+        if len(self.candidates) == 1:
+            word = words[self.candidates[0]]
+            if word not in self.tried_words:
+                return word
+        if len(self.candidates) == 0:
+            # სიტყვა ლექსიკონში არ არის — უბრალოდ სიხშირის რიგით
+            for letter in self.matrix.fallback:
+                code = letter_bit(letter).bit_length() - 1
+                if code >= len(self.tried) or not self.tried[code]:
+                    return letter
+            raise ValueError("ასოები ამოიწურა.")
+
+        patterns = reveal_patterns(self.codes[self.candidates], self.matrix.letters, self.weights)
+        self.__patterns = patterns
+        # ვაფასებთ მხოლოდ უნაცად ასოებს, რომლებიც ერთ კანდიდატში მაინც გვხვდება
+        hits = np.count_nonzero(patterns, axis=0)
+        columns = np.flatnonzero(~self.tried & (hits > 0))
+        # დამრგვალება, რომ მცურავი წერტილის ხმაურმა ტოლობა არ დაარღვიოს
+        entropy = np.round(partition_entropy(patterns[:, columns]), 9)
+        # თანაბარი ენტროპიისას — ასო, რომელიც მეტ კანდიდატშია (ნაკლები შეცდომის რისკი)
+        best = columns[np.lexsort((hits[columns], entropy))[-1]]
+        return LETTERS[best]
+
+    def update(self, guess, positions):
+        # positions — გახსნილი პოზიციები (ასოსთვის) ან None (არასწორი სიტყვისთვის)
+        if len(guess) > 1:
+            self.tried_words.add(guess)
+            words = self.matrix.words.get(self.skeleton, [])
+            keep = [i for i, c in enumerate(self.candidates) if words[c] != guess]
+            self.candidates = self.candidates[keep]
+            return
+        code = letter_bit(guess).bit_length() - 1
+        if code >= len(self.tried):
+            # ლექსიკონისთვის უცნობი ასო: თუ გაიხსნა, არცერთი კანდიდატი არ ემთხვევა
+            if positions:
+                self.candidates = self.candidates[:0]
+            return
+        self.tried[code] = True
+        observed = np.uint64(0)
+        for pos in positions:
+            observed |= self.weights[pos]
+        patterns = self.__patterns
+        if patterns is None or len(patterns) != len(self.candidates):
+            patterns = reveal_patterns(self.codes[self.candidates], self.matrix.letters, self.weights)
+        self.candidates = self.candidates[patterns[:, code] == observed]
+        self.__patterns = None
+
+
+def play(solver, word, max_errors=MAX_ERRORS):
+    # ერთი ავტომატური თამაში; აბრუნებს (მოგება, სვლები, შეცდომები)
+    game = HangmanGame(word, max_errors)
+    solver.start(skeleton(word))
+    lower = game.word_lower
+    guesses = 0
+    while not game.over:
+        guess = solver.choose()
+        result = game.guess(guess)
+        guesses += 1
+        if len(guess) > 1:
+            solver.update(guess, None)
+        else:
+            solver.update(guess, [i for i, ch in enumerate(lower) if ch == guess])
+        if result in (WON, LOST):
+            break
+    return game.won, guesses, game.wrong
+
+
+def evaluate(categories, max_errors=MAX_ERRORS):
+    # ამომხსნელი თითოეული კატეგორიის ყველა სიტყვაზე (ლექსიკონი = კატეგორია);
+    # სიტყვის სირთულე = შეცდომების რაოდენობა (წაგებისას max_errors)
+    report = {}
+    for category, words in categories.items():
+        solver = EntropySolver(WordMatrix(words))
+        start = time.perf_counter()
+        won = guesses = 0
+        difficulty = {}
+        for word in dict.fromkeys(words):
+            ok, steps, wrong = play(solver, word, max_errors)
+            won += ok
+            guesses += steps
+            difficulty[word] = wrong
+        elapsed = time.perf_counter() - start
+        report[category] = {
+            "words": len(difficulty),
+            "win_rate": round(won / len(difficulty), 4) if difficulty else 0,
+            "guesses": guesses,
+            "guesses_per_second": round(guesses / elapsed, 1) if elapsed else 0,
+            "seconds": round(elapsed, 3),
+            "hardest": sorted(difficulty.items(), key=lambda item: -item[1])[:10],
+        }
+    return report
+
+
+def read_words(filename):
+    with open(filename, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hangman-ის ენტროპიული ამომხსნელი")
+    parser.add_argument("--category", action="append", choices=list(WORD_CATEGORIES),
+                        help="შესაფასებელი კატეგორია (შეიძლება რამდენჯერმე; ნაგულისხმევად ყველა)")
+    parser.add_argument("--words", action="append", metavar="FILE",
+                        help="სიტყვების ფაილი (თითო ხაზზე), ცალკე კატეგორიად")
+    parser.add_argument("--max-errors", type=int, default=MAX_ERRORS)
+    parser.add_argument("--output", "-o", help="JSON ანგარიშის ფაილი (ნაგულისხმევად stdout)")
+    args = parser.parse_args(argv)
+
+    categories = {name: WORD_CATEGORIES[name] for name in (args.category or [])}
+    for filename in args.words or []:
+        categories[filename] = read_words(filename)
+    if not categories:
+        categories = dict(WORD_CATEGORIES)
+
+    report = evaluate(categories, args.max_errors)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# შეცდომებისადმი მდგრადი ძიების საერთო ნაწილები: ლევენშტაინის მანძილი და
+# SymSpell-ის სტილის წაშლების ინდექსი. იყენებს წიგნების აპლიკაცია
+# (fuzzy_search) და ლექსიკონი ("იქნებ გულისხმობდით")
+
+
+def edit_distance(a, b, limit=None):
+    # ლევენშტაინის მანძილი (ორი მწკრივი); limit-ის გადაჭარბებისას ადრე წყვეტს
+    # და აბრუნებს limit + 1-ს
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def single_edits(word, alphabet):
+    # ყველა სტრიქონი ლევენშტაინის მანძილზე 1 (წაშლა, ჩანაცვლება, ჩამატება)
+    # — ~(2·|alphabet| + 1)·len(word) ვარიანტი, ინდექსის გარეშე შესამოწმებლად
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    edits = {a + b[1:] for a, b in splits if b}
+    edits.update(a + c + b[1:] for a, b in splits if b for c in alphabet)
+    edits.update(a + c + b for a, b in splits for c in alphabet)
+    edits.discard(word)
+    return edits
+
+
+class DeletionIndex:
+    # SymSpell-ის სტილის ინდექსი: სიტყვის პრეფიქსიდან <= max_distance ასოს წაშლით
+    # მიღებული ყველა ვარიანტი -> სიტყვები. ძიებისას მოთხოვნის იგივე ვარიანტები
+    # ეძებნება და კანდიდატები ლევენშტაინით მოწმდება — ლექსიკონის ზომისგან დამოუკიდებლად.
+    # სიტყვას შეიძლება მიებას ელემენტები (მაგ. წიგნის id-ები); item=None — მხოლოდ სიტყვა
+    def __init__(self, max_distance=2, prefix_length=7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        # ვარიანტი -> {სიტყვა}
+        self.__deletes = {}
+        # სიტყვა -> {ელემენტი}
+        self.__items = {}
+
+    def __variants(self, word):
+        word = word[:self.prefix_length]
+        variants = frontier = {word}
+        for _ in range(self.max_distance):
+            frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+            variants = variants | frontier
+        return variants
+
+    def add(self, word, item=None):
+        items = self.__items.get(word)
+        if items is None:
+            items = self.__items[word] = set()
+            for v in self.__variants(word):
+                self.__deletes.setdefault(v, set()).add(word)
+        if item is not None:
+            items.add(item)
+
+    def remove(self, word, item=None):
+        items = self.__items.get(word)
+        if items is None:
+            return
+        items.discard(item)
+        if item is None or not items:
+            del self.__items[word]
+            for v in self.__variants(word):
+                bucket = self.__deletes[v]
+                bucket.discard(word)
+                if not bucket:
+                    del self.__deletes[v]
+
+    def search(self, word, max_distance=None):
+        # [(მანძილი, სიტყვა, ელემენტები), ...] მანძილითა და ანბანით დალაგებული
+        k = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        candidates = set()
+        for v in self.__variants(word):
+            candidates.update(self.__deletes.get(v, ()))
+        results = []
+        for candidate in candidates:
+            d = edit_distance(word, candidate, k)
+            if d <= k:
+                results.append((d, candidate, self.__items[candidate]))
+        results.sort(key=lambda result: result[:2])
+        return results
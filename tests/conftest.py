@@ -0,0 +1,28 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# ტესტები რეპოზიტორიის ფესვიდან: `python -m pytest -q`
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BOOKS_APP = os.path.join(ROOT, "წიგნების მართვის კონსოლ აპლიკაცია.py")
+
+
+@pytest.fixture(scope="session")
+def books_module():
+    # მოდული ქართული სახელით — ჩვეულებრივი import-ით ვერ ჩაიტვირთება
+    spec = importlib.util.spec_from_file_location("books_app", BOOKS_APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def books_app(books_module, tmp_path, monkeypatch):
+    # ყოველი ტესტი სუფთა id-ებით და საკუთარ დროებით საქაღალდეში
+    monkeypatch.chdir(tmp_path)
+    books_module.Book.next_id = 1
+    return books_module
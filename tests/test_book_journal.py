@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+
+def catalog(manager):
+    return sorted((b.id, b.title, b.author, b.year) for b in manager.iter_books())
+
+
+def journaled(app, filename="books.json"):
+    manager = app.BookManager()
+    manager.open_journal(filename)
+    return manager
+
+
+def fill(app, manager):
+    manager.add_book(app.Book("ვეფხისტყაოსანი", "შოთა რუსთაველი", 1712))
+    manager.add_book(app.Book("დათა თუთაშხია", "ჭაბუა ამირეჯიბი", 1975))
+    manager.add_book(app.Book("Solaris", "Stanislaw Lem", 1961))
+    manager.update_book(2, year=1976)
+    manager.delete_book_by_id(3)
+
+
+def test_replay_restores_unsnapshotted_changes(books_app):
+    manager = journaled(books_app)
+    fill(books_app, manager)
+    expected = catalog(manager)
+    manager.close()
+
+    assert catalog(journaled(books_app)) == expected
+
+
+def test_torn_tail_is_dropped_and_truncated(books_app):
+    manager = journaled(books_app)
+    fill(books_app, manager)
+    expected = catalog(manager)
+    manager.close()
+    # ავარია ჩაწერის შუაში: ბოლო ხაზი ნახევრადაა ჩაწერილი
+    with open("books.json.log", "ab") as f:
+        f.write(b'{"op": "add", "id": 9, "title": "')
+
+    manager = journaled(books_app)
+    assert catalog(manager) == expected
+    # ახალი ჩანაწერი დაზიანებულ კუდს არ მიეწებება
+    manager.add_book(books_app.Book("ხიზნები", "ილია ჭავჭავაძე", 1880))
+    expected = catalog(manager)
+    manager.close()
+    with open("books.json.log", "rb") as f:
+        lines = f.read().splitlines()
+    assert all(json.loads(line) for line in lines)
+
+    assert catalog(journaled(books_app)) == expected
+
+
+def test_replay_over_newer_snapshot_is_idempotent(books_app):
+    manager = journaled(books_app)
+    fill(books_app, manager)
+    expected = catalog(manager)
+    # ავარია compact-ის შუაში: snapshot უკვე ჩანაცვლდა, ჟურნალი კი ჯერ არ გასუფთავებულა
+    manager.save_to_file("books.json")
+    manager.close()
+
+    assert catalog(journaled(books_app)) == expected
+    assert catalog(journaled(books_app)) == expected
+
+
+def test_compact_clears_the_log(books_app):
+    manager = journaled(books_app)
+    fill(books_app, manager)
+    expected = catalog(manager)
+    manager.compact()
+    manager.close()
+
+    with open("books.json.log", "rb") as f:
+        assert f.read() == b""
+    assert catalog(journaled(books_app)) == expected
+
+
+def test_partial_batch_is_journaled(books_app):
+    manager = journaled(books_app)
+    manager.add_book(books_app.Book("Solaris", "Stanislaw Lem", 1961))
+    batch = [books_app.Book("Eden", "Stanislaw Lem", 1959), manager.get_book_by_id(1),
+             books_app.Book("Fiasco", "Stanislaw Lem", 1986)]
+    with pytest.raises(ValueError):
+        manager.add_books(batch)
+    expected = catalog(manager)
+    manager.close()
+
+    reopened = journaled(books_app)
+    assert catalog(reopened) == expected
+    assert [b.title for b in reopened.iter_books()] == ["Solaris", "Eden"]
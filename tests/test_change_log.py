@@ -0,0 +1,84 @@
+import json
+import os
+
+import pytest
+
+import dictionary
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dictionary.create_default_dictionary("dictionary.json")
+    return tmp_path
+
+
+def service(**options):
+    return dictionary.DictionaryService("dictionary.json", compiled=None, **options)
+
+
+def test_replay_stops_at_torn_tail_and_truncates(workdir):
+    log = dictionary.ChangeLog("changes.log")
+    log.append({"pair": "ka-en", "word": "სახლი", "translation": "house"})
+    log.append({"pair": "ka-en", "word": "ხე", "translation": "tree"})
+    log.close()
+    with open("changes.log", "ab") as f:
+        f.write('{"pair": "ka-en", "word": "მზ'.encode())
+
+    records = list(dictionary.ChangeLog("changes.log").replay())
+    assert [r["word"] for r in records] == ["სახლი", "ხე"]
+    with open("changes.log", "rb") as f:
+        assert all(json.loads(line) for line in f.read().splitlines())
+    # მეორე გავლა იმავე ჩანაწერებს აბრუნებს
+    assert list(dictionary.ChangeLog("changes.log").replay()) == records
+
+
+def test_added_pairs_survive_restart_without_snapshot_rewrite(workdir):
+    before = os.stat("dictionary.json").st_mtime_ns
+    words = service()
+    words.add("ka-en", "სახლი", "house")
+    words.close()
+    assert os.stat("dictionary.json").st_mtime_ns == before
+
+    words = service()
+    assert words.lookup("ka-en", "სახლი") == "house"
+    assert words.lookup("en-ka", "house") == "სახლი"
+
+
+def test_torn_tail_in_service_log(workdir):
+    words = service()
+    words.add("ka-en", "სახლი", "house")
+    words.close()
+    with open("dictionary.json.log", "ab") as f:
+        f.write(b'{"pair": "ka-en", "word": "')
+
+    words = service()
+    assert words.lookup("ka-en", "სახლი") == "house"
+    words.add("ka-en", "ხე", "tree")
+    words.close()
+    assert service().lookup("en-ka", "tree") == "ხე"
+
+
+def test_replay_over_compacted_snapshot_is_idempotent(workdir):
+    words = service()
+    words.add("ka-en", "სახლი", "house")
+    words.add("ka-en", "კატა", "kitty")
+    expected = words.snapshot()
+    # ავარია შეკუმშვის შუაში: snapshot ჩანაცვლდა, ჟურნალი კი ჯერ არ გასუფთავებულა
+    dictionary.save_dictionary(expected, "dictionary.json")
+    words.close()
+
+    assert service().snapshot() == expected
+    assert service().snapshot() == expected
+
+
+def test_compaction_threshold_follows_dictionary_size(workdir):
+    # ნაგულისხმევი ლექსიკონი 8 ჩანაწერია: compact_every=2-ზე ჟურნალი 8 ჩანაწერამდე იზრდება
+    words = service(compact_every=2)
+    for n in range(7):
+        words.add("ka-en", f"სიტყვა{n}", f"word{n}")
+    assert os.path.getsize("dictionary.json.log") > 0
+    words.add("ka-en", "ბოლო", "last")
+    assert os.path.getsize("dictionary.json.log") == 0
+    assert words.lookup("en-ka", "last") == "ბოლო"
+    words.close()
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+TITLE_WORDS = ["ვეფხისტყაოსანი", "დათა", "თუთაშხია", "Solaris", "Eden", "war", "peace", "ᲓᲐᲗᲐ"]
+AUTHORS = ["შოთა რუსთაველი", "ჭაბუა ამირეჯიბი", "Stanislaw Lem", "Leo Tolstoy"]
+
+
+def listing(books):
+    return [(b.id, b.title, b.author, b.year) for b in books]
+
+
+@pytest.fixture
+def catalogs(books_app):
+    # ერთი და იგივე კატალოგი BookManager-ში და სანდო ფაილიდან სვეტურ რეჟიმში
+    rng = random.Random(3)
+    manager = books_app.BookManager()
+    manager.add_books(
+        books_app.Book(" ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(1, 3))),
+                       rng.choice(AUTHORS), rng.randint(1800, 2020))
+        for _ in range(300))
+    manager.save_trusted("books.jsonl")
+    return manager, books_app.ColumnarBookManager("books.jsonl")
+
+
+def test_columnar_queries_match_book_manager(books_app, catalogs):
+    manager, columnar = catalogs
+    for key in (None, "title", "author", "year"):
+        assert listing(columnar.iter_books(key)) == listing(manager.iter_books(key))
+    for query in ("", "ა", "war", "დათა", "zz"):
+        assert listing(columnar.search_by_title(query)) == listing(manager.search_by_title(query))
+    assert listing(columnar.find_by_year_range(1900, 1950)) == listing(manager.find_by_year_range(1900, 1950))
+    assert listing(columnar.find_by_author("leo tolstoy")) == listing(manager.find_by_author("leo tolstoy"))
+    assert columnar.count_by_decade() == manager.count_by_decade()
+    assert all(isinstance(b, books_app.BookView) for b in columnar.iter_books())
+
+
+def test_columnar_changes_are_saved(books_app, catalogs):
+    manager, columnar = catalogs
+    for m in (manager, columnar):
+        # BookView-ის setter-ი პირდაპირ სვეტებში წერს
+        m.get_book_by_id(5).year = 1999
+        m.update_book(6, title="ახალი სათაური", author="Ann Lee")
+        m.delete_book_by_id(7)
+        m.add_book(books_app.Book.restore(301, "Fiasco", "Stanislaw Lem", 1986))
+    with pytest.raises(ValueError):
+        columnar.update_book(8, title=" ")
+    assert columnar.get_book_by_id(7) is None
+    columnar.close()
+
+    reopened = books_app.ColumnarBookManager("books.jsonl")
+    assert listing(reopened.iter_books("year")) == listing(manager.iter_books("year"))
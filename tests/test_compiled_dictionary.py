@@ -0,0 +1,85 @@
+import pytest
+
+import dictionary
+
+DATA = {
+    "ka-en": {"კატა": "cat", "ძაღლი": "dog", "ხე": "tree", "ხელი": "hand"},
+    "en-ka": {"cat": "კატა", "dog": "ძაღლი", "tree": "ხე", "hand": "ხელი"},
+    "ru-ka": {"кошка": "კატა"},
+    "ka-ru": {},
+}
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    dictionary.save_dictionary(DATA, "dictionary.json")
+    return tmp_path
+
+
+def test_round_trip(workdir):
+    stamp = dictionary.file_stamp("dictionary.json")
+    dictionary.compile_dictionary(DATA, "dictionary.bin", stamp)
+    compiled = dictionary.CompiledDictionary("dictionary.bin")
+    try:
+        assert compiled.source_stamp == stamp
+        assert sorted(compiled) == sorted(DATA)
+        for pair, words in DATA.items():
+            assert dict(compiled[pair].items()) == words
+            assert len(compiled[pair]) == len(words)
+            for word, translation in words.items():
+                assert word in compiled[pair]
+                assert compiled[pair].get(word) == translation
+            assert compiled[pair].get("არარსებული") is None
+        assert list(compiled["ka-en"].prefixed("ხე")) == ["ხე", "ხელი"]
+    finally:
+        compiled.close()
+
+
+def test_unknown_magic_is_rejected(workdir):
+    with open("dictionary.bin", "wb") as f:
+        f.write(b"NOTADICT" + bytes(64))
+    with pytest.raises(ValueError):
+        dictionary.CompiledDictionary("dictionary.bin")
+
+
+def test_service_uses_compiled_file_when_stamp_matches(workdir):
+    words = dictionary.DictionaryService()
+    words.compile()
+    words.close()
+
+    words = dictionary.DictionaryService()
+    assert words.is_compiled
+    assert words.lookup("ka-en", "ძაღლი") == "dog"
+    assert words.snapshot() == DATA
+    words.close()
+
+
+def test_stale_compiled_file_falls_back_to_json(workdir):
+    words = dictionary.DictionaryService()
+    words.compile()
+    words.close()
+    # JSON გარედან შეიცვალა — კომპილირებული ფაილი აღარ შეესაბამება
+    edited = {pair: dict(items) for pair, items in DATA.items()}
+    edited["ka-en"]["კატა"] = "kitten"
+    dictionary.save_dictionary(edited, "dictionary.json")
+
+    words = dictionary.DictionaryService()
+    assert not words.is_compiled
+    assert words.lookup("ka-en", "კატა") == "kitten"
+    words.close()
+
+
+def test_compaction_keeps_compiled_mode(workdir):
+    words = dictionary.DictionaryService()
+    words.compile()
+    words.add("ka-en", "მზე", "sun")
+    words.compact()
+    assert words.is_compiled
+    assert words.lookup("en-ka", "sun") == "მზე"
+    words.close()
+
+    words = dictionary.DictionaryService()
+    assert words.is_compiled
+    assert words.lookup("ka-en", "მზე") == "sun"
+    words.close()
@@ -0,0 +1,26 @@
+import pytest
+
+
+@pytest.mark.parametrize("request_", [
+    {"op": "add", "title": 5, "author": "Ann Lee", "year": 2000},
+    {"op": "add", "title": "Solaris", "author": "Stanislaw Lem", "year": True},
+    {"op": "add", "title": "Solaris", "author": "Stanislaw Lem", "year": [1961]},
+    {"op": "search", "query": None},
+    {"op": "get", "id": "x"},
+    {"op": "list", "limit": 2.5},
+])
+def test_wrong_field_types_are_rejected(books_app, request_):
+    manager = books_app.ConcurrentBookManager()
+    with pytest.raises(ValueError):
+        books_app.dispatch(manager, request_)
+    # უარყოფილი მოთხოვნა id-ს არ ხარჯავს
+    book = books_app.dispatch(manager, {"op": "add", "title": "Solaris", "author": "Stanislaw Lem", "year": "1961"})
+    assert book["id"] == 1
+
+
+def test_edit_with_wrong_type_changes_nothing(books_app):
+    manager = books_app.ConcurrentBookManager()
+    books_app.dispatch(manager, {"op": "add", "title": "Solaris", "author": "Stanislaw Lem", "year": 1961})
+    with pytest.raises(ValueError):
+        books_app.dispatch(manager, {"op": "edit", "id": 1, "title": "Eden", "author": 5})
+    assert books_app.dispatch(manager, {"op": "get", "id": 1})["title"] == "Solaris"
@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.mark.parametrize("manager_class", ["BookManager", "ConcurrentBookManager"])
+def test_larger_distance_after_index_is_built(books_app, manager_class):
+    manager = getattr(books_app, manager_class)()
+    manager.add_book(books_app.Book("Solaris", "Stanislaw Lem", 1961))
+    # პირველი ძიება ინდექსს max_distance=2-ით აგებს
+    assert manager.fuzzy_search("Solxyzs", 2) == []
+    assert [(d, b.title) for d, b in manager.fuzzy_search("Solxyzs", 3)] == [(3, "Solaris")]
+    assert [(d, b.title) for d, b in manager.fuzzy_search("Solaxs", 2)] == [(2, "Solaris")]
@@ -0,0 +1,27 @@
+import json
+
+import pytest
+
+
+def write_catalog(path, ids):
+    path.write_text(json.dumps([{"id": i, "title": f"Book {i}", "author": "Ann Lee", "year": 2000 + i}
+                                for i in ids]), encoding="utf-8")
+
+
+def test_migrate_refuses_non_empty_database(books_app, tmp_path):
+    write_catalog(tmp_path / "books.json", [1, 2, 3])
+    manager = books_app.SQLiteBookManager(str(tmp_path / "books.db"))
+    assert manager.migrate_from_json("books.json") == 3
+    with pytest.raises(ValueError):
+        manager.migrate_from_json("books.json")
+    assert sorted(b.id for b in manager.iter_books()) == [1, 2, 3]
+    manager.close()
+
+
+def test_migrate_duplicate_ids_leave_database_empty(books_app, tmp_path):
+    write_catalog(tmp_path / "books.json", [1, 2, 1])
+    manager = books_app.SQLiteBookManager(str(tmp_path / "books.db"))
+    with pytest.raises(ValueError):
+        manager.migrate_from_json("books.json")
+    assert list(manager.iter_books()) == []
+    manager.close()
@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+TITLE_WORDS = ["ვეფხისტყაოსანი", "დათა", "თუთაშხია", "მთვარის", "მოტაცება", "Solaris", "Eden",
+               "war", "peace", "night", "the", "of", "love", "ᲓᲐᲗᲐ"]
+QUERIES = ["", "a", "ე", "ვე", "war", "WAR", "the war", "ისტყაოს", "დათა თუ", "of love", "zz", "xyz"]
+
+
+def linear_search(app, manager, query):
+    # საბაზისო ძიება: ყველა წიგნის სათაურის გადარჩევა მიმდინარე რიგით
+    query = app.collation_key(query)
+    return [b.id for b in manager.iter_books() if query in app.collation_key(b.title)]
+
+
+@pytest.mark.parametrize("manager_class", ["BookManager", "ConcurrentBookManager"])
+def test_indexed_search_matches_linear_scan(books_app, manager_class):
+    rng = random.Random(7)
+    manager = getattr(books_app, manager_class)()
+    manager.add_books(
+        books_app.Book(" ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(1, 4))),
+                       "Ann Lee", rng.randint(1900, 2020))
+        for _ in range(500))
+    manager.search_by_title("the")
+
+    # ინდექსი აგების შემდეგ ნაზრდად უნდა განახლდეს
+    for book_id in rng.sample(range(1, 501), 50):
+        manager.update_book(book_id, title=rng.choice(TITLE_WORDS) + " night")
+    for book_id in rng.sample(range(1, 501), 50):
+        manager.delete_book_by_id(book_id)
+    manager.sort_books("title")
+
+    for query in QUERIES:
+        assert [b.id for b in manager.search_by_title(query)] == linear_search(books_app, manager, query)
@@ -0,0 +1,62 @@
+import pytest
+
+
+def catalog(manager):
+    return sorted((b.id, b.title, b.author, b.year) for b in manager.iter_books())
+
+
+@pytest.fixture
+def saved(books_app):
+    manager = books_app.BookManager()
+    manager.add_book(books_app.Book("ვეფხისტყაოსანი", "შოთა რუსთაველი", 1712))
+    manager.add_book(books_app.Book("Solaris", "Stanislaw Lem", 1961))
+    manager.save_trusted("books.jsonl")
+    return catalog(manager)
+
+
+def test_round_trip(books_app, saved):
+    manager = books_app.BookManager()
+    assert manager.load_trusted("books.jsonl") == 2
+    assert catalog(manager) == saved
+
+
+def rewrite(lines, index, old, new):
+    lines[index] = lines[index].replace(old, new)
+    with open("books.jsonl", "wb") as f:
+        f.writelines(lines)
+
+
+@pytest.mark.parametrize("index, old, new", [
+    (1, "1712".encode(), "1713".encode()),   # ჩანაწერი შეიცვალა
+    (-1, b'"sha256": "', b'"sha256": "0'),   # საკონტროლო ჯამი შეიცვალა
+    (0, b'"count": 2', b'"count": 3'),        # რაოდენობა არ ემთხვევა
+])
+def test_corrupted_file_is_rejected_and_catalog_kept(books_app, saved, index, old, new):
+    with open("books.jsonl", "rb") as f:
+        lines = f.readlines()
+    rewrite(lines, index, old, new)
+
+    manager = books_app.BookManager()
+    manager.add_book(books_app.Book("ხიზნები", "ილია ჭავჭავაძე", 1880))
+    before = catalog(manager)
+    with pytest.raises(ValueError):
+        manager.load_trusted("books.jsonl")
+    assert catalog(manager) == before
+
+
+def test_truncated_file_is_rejected(books_app, saved):
+    with open("books.jsonl", "rb") as f:
+        lines = f.readlines()
+    with open("books.jsonl", "wb") as f:
+        f.writelines(lines[:-1])
+
+    with pytest.raises(ValueError):
+        books_app.BookManager().load_trusted("books.jsonl")
+
+
+def test_unknown_format_is_rejected(books_app):
+    with open("books.jsonl", "w", encoding="utf-8") as f:
+        f.write('{"format": "other", "version": 1, "count": 0}\n')
+
+    with pytest.raises(ValueError):
+        books_app.BookManager().load_trusted("books.jsonl")
@@ -1,5 +1,25 @@
+import argparse
+import asyncio
+import csv
+import hashlib
 import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime
+from itertools import islice
+
+from spelling import DeletionIndex
 
 # ============================
 #       VALIDATION
@@ -33,19 +53,186 @@ def validate_year(year_str: str):
     return True, year
 
 
+# ============================
+#       COLLATION
+# ============================
+# ნუსხური (და casefold-ის შემდეგ ასომთავრული) -> მხედრული.
+# მხედრული ასოები Unicode-ში ანბანის რიგითაა, მთავრულს კი casefold თავად ასწორებს.
+_GEORGIAN_FOLD = {0x2D00 + i: 0x10D0 + i for i in range(0x26)}
+
+
+def collation_key(text):
+    # სორტირებისა და ძიების გასაღები: NFC + casefold + ქართული დამწერლობების გაერთიანება
+    return unicodedata.normalize("NFC", text).casefold().translate(_GEORGIAN_FOLD)
+
+
+# ============================
+#       N-GRAM ინდექსი
+# ============================
+NGRAM = 3
+
+
+def title_ngrams(text):
+    # სათაურის ყველა განსხვავებული ტრიგრამა; NGRAM-ზე მოკლე მოთხოვნები ინდექსს
+    # არ იყენებენ — სათაურების პირდაპირი გადარჩევით იძებნება
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+# ============================
+#       FUZZY ინდექსი
+# ============================
+# edit_distance და DeletionIndex — spelling.py-ში (საერთოა ლექსიკონთან)
+def words(text):
+    return re.findall(r"\w+", text)
+
+
+# ============================
+#       DUPLICATES (MinHash/LSH)
+# ============================
+class MinHashLSH:
+    # ტექსტის სიმბოლოთა shingle-ების MinHash ხელმოწერა, დაყოფილი bands ზოლად;
+    # ერთ ზოლში სრულად დამთხვეული ხელმოწერები ერთ bucket-ში ხვდება და მხოლოდ
+    # ისინი ითვლება დუბლიკატის კანდიდატებად (წყვილების სრული შედარების გარეშე)
+    def __init__(self, num_perm=64, bands=16, shingle=3, seed=0x9E3779B1):
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.num_perm = self.bands * self.rows
+        self.shingle = shingle
+        self.seed = seed
+        # ელემენტი -> ხელმოწერა
+        self.__signatures = {}
+        # (ზოლი, ზოლის მნიშვნელობები) -> {ელემენტი}
+        self.__buckets = {}
+
+    def signature(self, text):
+        # one-permutation hashing: თითო shingle ერთხელ ჰეშირდება და თავის bin-ში
+        # მინიმუმს ანახლებს; ცარიელი bin-ები ივსება მარჯვენა მეზობლიდან (rotation)
+        n, k = self.shingle, self.num_perm
+        bins = [None] * k
+        for i in range(max(1, len(text) - n + 1)):
+            h = (zlib.crc32(text[i:i + n].encode("utf-8")) * self.seed) & 0xFFFFFFFF
+            b, v = h % k, h // k
+            if bins[b] is None or v < bins[b]:
+                bins[b] = v
+        if None in bins:
+            original = bins[:]
+            step = (1 << 32) // k + 1
+            nearest, distance = None, 0
+            for b in range(2 * k - 1, -1, -1):
+                value = original[b % k]
+                if value is not None:
+                    nearest, distance = value, 0
+                else:
+                    distance += 1
+                    if b < k:
+                        bins[b] = nearest + step * distance
+        return tuple(bins)
+
+    def __bands(self, signature):
+        r = self.rows
+        return [(i, signature[i * r:(i + 1) * r]) for i in range(self.bands)]
+
+    def add(self, item, text):
+        signature = self.__signatures[item] = self.signature(text)
+        for band in self.__bands(signature):
+            self.__buckets.setdefault(band, set()).add(item)
+
+    def remove(self, item):
+        signature = self.__signatures.pop(item, None)
+        if signature is None:
+            return
+        for band in self.__bands(signature):
+            bucket = self.__buckets[band]
+            bucket.discard(item)
+            if not bucket:
+                del self.__buckets[band]
+
+    def similarity(self, a, b):
+        # ჟაკარის მსგავსების შეფასება: ხელმოწერების დამთხვეული პოზიციების წილი
+        sa, sb = self.__signatures[a], self.__signatures[b]
+        return sum(x == y for x, y in zip(sa, sb)) / len(sa)
+
+    def clusters(self, threshold=0.5):
+        # bucket-ის ყოველი წევრი მოწმდება bucket-ის წარმომადგენლებთან (თითო ნაპოვნ
+        # ჯგუფზე ერთი) და union-find-ით ერთიანდება; ვერცერთს თუ ემთხვევა, თავად ხდება
+        # წარმომადგენელი. ასე შემთხვევითი კოლიზია bucket-ის დანარჩენ დუბლიკატებს ვერ
+        # "დაბლოკავს". ღირებულება: bucket-ის ზომა × მასში არსებული ჯგუფების რაოდენობა
+        parent = {}
+
+        def find(x):
+            root = x
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while x != root:
+                parent[x], x = root, parent[x]
+            return root
+
+        def union(a, b):
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent.setdefault(ra, ra)
+                parent[rb] = ra
+
+        for bucket in self.__buckets.values():
+            if len(bucket) < 2:
+                continue
+            representatives = []
+            for item in bucket:
+                matched = False
+                for rep in representatives:
+                    if self.similarity(rep, item) >= threshold:
+                        union(rep, item)
+                        matched = True
+                if not matched:
+                    representatives.append(item)
+
+        groups = {}
+        for item in parent:
+            groups.setdefault(find(item), []).append(item)
+        return [group for group in groups.values() if len(group) > 1]
+
+
 # ============================
 #           BOOK
 # ============================
 class Book:
+    # __slots__ — __dict__-ის გარეშე, მილიონობით ჩანაწერისთვის
+    __slots__ = ("__id", "__title", "__author", "__year", "_manager")
+
     next_id = 1
 
     def __init__(self, title, author, year):
-        self.__id = Book.next_id
-        Book.next_id += 1
+        # მენეჯერი, რომლის ინდექსებიც ცვლილებისას უნდა განახლდეს
+        self._manager = None
 
         self.title = title
         self.author = author
         self.year = year
+        # id მხოლოდ წარმატებული ვალიდაციის შემდეგ — არასწორი წიგნი next_id-ს არ ხარჯავს
+        self.__id = Book.next_id
+        Book.next_id += 1
+
+    @classmethod
+    def restore(cls, book_id, title, author, year):
+        # შენახული წიგნის აღდგენა არსებული id-ით (next_id არ იცვლება)
+        book = cls.__new__(cls)
+        book.__id = book_id
+        book._manager = None
+        book.title = title
+        book.author = author
+        book.year = year
+        return book
+
+    @classmethod
+    def trusted(cls, book_id, title, author, year):
+        # ჩვენივე შემოწმებული ფაილიდან აღდგენა — ვალიდაციის გარეშე
+        book = cls.__new__(cls)
+        book.__id = book_id
+        book.__title = title
+        book.__author = author
+        book.__year = year
+        book._manager = None
+        return book
 
     # ----- ID (read-only) -----
     @property
@@ -62,7 +249,11 @@ class Book:
         value = value.strip()
         if not value:
             raise ValueError("სათაური არ შეიძლება იყოს ცარიელი.")
+        manager = self._manager
+        old = self.__title if manager else None
         self.__title = value
+        if manager:
+            manager._book_changed(self, "title", old)
 
     # ----- AUTHOR -----
     @property
@@ -74,7 +265,11 @@ class Book:
         ok, result = validate_author(value)
         if not ok:
             raise ValueError(result)
+        manager = self._manager
+        old = self.__author if manager else None
         self.__author = result
+        if manager:
+            manager._book_changed(self, "author", old)
 
     # ----- YEAR -----
     @property
@@ -86,61 +281,632 @@ class Book:
         ok, result = validate_year(str(value))
         if not ok:
             raise ValueError(result)
+        manager = self._manager
+        old = self.__year if manager else None
         self.__year = result
+        if manager:
+            manager._book_changed(self, "year", old)
 
     def __str__(self):
         return f"[{self.id}] '{self.title}' — {self.author}, {self.year}"
 
 
+# ============================
+#       TRUSTED FORMAT
+# ============================
+# JSON lines: სათაური {"format", "version", "count"}, ჩანაწერები [id, title, author, year],
+# ბოლოს {"sha256"} — ჩანაწერების ხაზების საკონტროლო ჯამი
+TRUSTED_FORMAT = "books-trusted"
+TRUSTED_VERSION = 1
+
+
+def read_trusted(filename):
+    # ნაკადურად აბრუნებს [id, title, author, year] ჩანაწერებს; საკონტროლო ჯამი
+    # მოწმდება ბოლოს, ამიტომ შედეგი გამოიყენეთ მხოლოდ გენერატორის ამოწურვის შემდეგ
+    digest = hashlib.sha256()
+    decode = json.JSONDecoder().decode
+    count = 0
+    trailer = None
+    with open(filename, "rb") as f:
+        header = json.loads(f.readline() or b"{}")
+        if header.get("format") != TRUSTED_FORMAT or header.get("version") != TRUSTED_VERSION:
+            raise ValueError(f"{filename}: უცნობი ფაილის ფორმატი ან ვერსია.")
+        for line in f:
+            if line.startswith(b"{"):
+                trailer = json.loads(line)
+                break
+            digest.update(line)
+            count += 1
+            yield decode(line.decode("utf-8"))
+
+    if (trailer is None or trailer.get("sha256") != digest.hexdigest()
+            or count != header["count"]):
+        raise ValueError(f"{filename}: ფაილი დაზიანებულია (საკონტროლო ჯამი არ ემთხვევა).")
+
+
+def write_trusted(filename, books, count):
+    # ატომური ჩაწერა დროებით ფაილში; books — id/title/author/year ატრიბუტების მქონე ობიექტები
+    digest = hashlib.sha256()
+    tmp = filename + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        header = {"format": TRUSTED_FORMAT, "version": TRUSTED_VERSION, "count": count}
+        f.write(json.dumps(header) + "\n")
+        for b in books:
+            line = json.dumps([b.id, b.title, b.author, b.year], ensure_ascii=False) + "\n"
+            digest.update(line.encode("utf-8"))
+            f.write(line)
+        f.write(json.dumps({"sha256": digest.hexdigest()}) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, filename)
+
+
+# ============================
+#       JOURNAL
+# ============================
+class BookJournal:
+    # append-only ჟურნალი (JSON lines) snapshot-ის გვერდით: books.json + books.json.log
+    def __init__(self, filename="books.json", fsync_every=64, compact_every=10000):
+        self.filename = filename
+        self.log_filename = filename + ".log"
+        self.fsync_every = fsync_every
+        self.compact_every = compact_every
+        self.__file = None
+        self.__unsynced = 0
+        self.__records = 0
+        self.__valid_end = None
+
+    def replay(self):
+        # აბრუნებს ჟურნალის ჩანაწერებს; ავარიისას ნაწილობრივ ჩაწერილ ბოლო ხაზზე ჩერდება
+        self.__valid_end = None
+        try:
+            with open(self.log_filename, "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError
+                        record = json.loads(line)
+                    except ValueError:
+                        self.__valid_end = offset
+                        break
+                    offset += len(line)
+                    self.__records += 1
+                    yield record
+        except FileNotFoundError:
+            return
+
+    def open(self):
+        self.__file = open(self.log_filename, "a", encoding="utf-8")
+        if self.__valid_end is not None:
+            # ვაჭრით დაზიანებულ კუდს, რომ ახალი ჩანაწერები მას არ მიეწებოს
+            self.__file.truncate(self.__valid_end)
+            self.__valid_end = None
+
+    def append(self, record):
+        self.__file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.__file.flush()
+        self.__unsynced += 1
+        self.__records += 1
+        if self.__unsynced >= self.fsync_every:
+            self.sync()
+
+    def sync(self):
+        if self.__file and self.__unsynced:
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+            self.__unsynced = 0
+
+    def needs_compaction(self, catalog_size=0):
+        # ჟურნალი იკუმშება, როცა კატალოგის ზომას გადააჭარბებს — ასე ჩაწერის ღირებულება
+        # ამორტიზებულად O(1) რჩება მასობრივი იმპორტის დროსაც
+        return self.__records >= max(self.compact_every, catalog_size)
+
+    def truncate(self):
+        # იძახება მას შემდეგ, რაც ახალი snapshot ატომურად ჩანაცვლდა
+        self.__file.close()
+        self.__file = open(self.log_filename, "w", encoding="utf-8")
+        os.fsync(self.__file.fileno())
+        self.__unsynced = 0
+        self.__records = 0
+
+    def close(self):
+        if self.__file:
+            self.sync()
+            self.__file.close()
+            self.__file = None
+
+
+# ============================
+#       LISTING OUTPUT
+# ============================
+PAGE_SIZE = 50
+
+
+def paginate(books, page_size=PAGE_SIZE):
+    # გენერატორი: წიგნების სიები page_size ზომით, მთელი კატალოგის მეხსიერებაში ჩატვირთვის გარეშე
+    books = iter(books)
+    while True:
+        page = list(islice(books, page_size))
+        if not page:
+            return
+        yield page
+
+
+def write_listing(books, stream=None, start=1, batch_size=1000):
+    # batch_size ხაზი ერთი write-ით (print-ის ნაცვლად თითო წიგნზე); აბრუნებს რაოდენობას
+    stream = sys.stdout if stream is None else stream
+    n = start - 1
+    for page in paginate(books, batch_size):
+        stream.write("".join(f"{n + i}. {b}\n" for i, b in enumerate(page, start=1)))
+        n += len(page)
+    stream.flush()
+    return n - start + 1
+
+
+def export_listing(manager, filename="-", key=None):
+    # არაინტერაქტიული ექსპორტი ფაილში ან stdout-ში ("-") დიდი ბუფერით
+    if filename == "-":
+        return write_listing(manager.iter_books(key), sys.stdout, batch_size=10000)
+    with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+        return write_listing(manager.iter_books(key), f, batch_size=10000)
+
+
 # ============================
 #       BOOK MANAGER
 # ============================
 class BookManager:
+    SORT_KEYS = ("title", "author", "year")
+
     def __init__(self):
-        self.__books = []
+        self.__books = {}
+        self.__journal = None
+        self.__clear()
+
+    def __clear(self):
+        for b in self.__books.values():
+            b._manager = None
+        # id -> Book (ჩასმის რიგის შენარჩუნებით)
+        self.__books = {}
+        # მეორადი ინდექსები: ავტორი / წელი -> {id: Book}
+        self.__by_author = {}
+        self.__by_year = {}
+        # ათწლეული -> წიგნების რაოდენობა (წლების რაოდენობა = len(by_year[წელი]))
+        self.__decades = {}
+        # სათაურის ტრიგრამა -> დალაგებული array("I") id-ებით; იგება პირველ ძიებაზე,
+        # შემდეგ ნაზრდად ახლდება
+        self.__grams = None
+        # სათაურებისა და ავტორების სიტყვების DeletionIndex შეცდომებისადმი მდგრადი
+        # ძიებისთვის; იგება პირველ fuzzy_search-ზე, შემდეგ ნაზრდად ახლდება
+        self.__fuzzy = None
+        # დუბლიკატების MinHash/LSH ინდექსი; იგება პირველ find_duplicates-ზე
+        self.__lsh = None
+        # id -> ქეშირებული collation გასაღები
+        self.__title_keys = {}
+        self.__author_keys = {}
+        # დალაგებული ხედები: [(გასაღები, id), ...]
+        self.__views = {key: [] for key in self.SORT_KEYS}
+        # მიმდინარე სიის რიგი (None — დამატების რიგი)
+        self.__order = None
+        # id -> დამატების რიგითი ნომერი
+        self.__pos = {}
+        self.__seq = 0
+
+    # ----- ინდექსები -----
+    def __index(self, book):
+        book_id = book.id
+        self.__title_keys[book_id] = collation_key(book.title)
+        author_key = self.__author_keys[book_id] = collation_key(book.author)
+        self.__by_author.setdefault(author_key, {})[book_id] = book
+        self.__by_year.setdefault(book.year, {})[book_id] = book
+        self.__count_decade(book.year, 1)
+        self.__index_title(book_id)
+        self.__index_text(book_id)
+
+    def __unindex(self, book):
+        self.__unindex_text(book.id)
+        for key in self.SORT_KEYS:
+            self.__view_remove(key, self.__view_entry(key, book))
+        self.__discard(self.__by_author, self.__author_keys.pop(book.id), book.id)
+        self.__discard(self.__by_year, book.year, book.id)
+        self.__count_decade(book.year, -1)
+        self.__unindex_title(book.id)
+        del self.__title_keys[book.id]
+
+    def __index_title(self, book_id):
+        if self.__grams is None:
+            return
+        grams = self.__grams
+        for g in title_ngrams(self.__title_keys[book_id]):
+            postings = grams.get(g)
+            if postings is None:
+                grams[g] = array("I", (book_id,))
+            else:
+                insort(postings, book_id)
+
+    def __unindex_title(self, book_id):
+        if self.__grams is None:
+            return
+        grams = self.__grams
+        for g in title_ngrams(self.__title_keys[book_id]):
+            postings = grams[g]
+            del postings[bisect_left(postings, book_id)]
+            if not postings:
+                del grams[g]
+
+    def __fuzzy_terms(self, book_id):
+        # სათაურისა და ავტორის სიტყვები
+        return set(words(self.__title_keys[book_id])) | set(words(self.__author_keys[book_id]))
+
+    def __dedup_text(self, book_id):
+        # ნორმალიზებული "სათაური ავტორი" — პუნქტუაციისა და ზედმეტი სივრცეების გარეშე
+        return " ".join(words(self.__title_keys[book_id]) + words(self.__author_keys[book_id]))
+
+    def __index_text(self, book_id):
+        # სათაურსა და ავტორზე დამოკიდებული ზარმაცი ინდექსები (fuzzy, დუბლიკატები)
+        if self.__fuzzy is not None:
+            for term in self.__fuzzy_terms(book_id):
+                self.__fuzzy.add(term, book_id)
+        if self.__lsh is not None:
+            self.__lsh.add(book_id, self.__dedup_text(book_id))
+
+    def __unindex_text(self, book_id):
+        if self.__fuzzy is not None:
+            for term in self.__fuzzy_terms(book_id):
+                self.__fuzzy.remove(term, book_id)
+        if self.__lsh is not None:
+            self.__lsh.remove(book_id)
+
+    def __count_decade(self, year, delta):
+        decade = year - year % 10
+        count = self.__decades.get(decade, 0) + delta
+        if count:
+            self.__decades[decade] = count
+        else:
+            del self.__decades[decade]
+
+    def __view_entry(self, key, book):
+        if key == "title":
+            return self.__title_keys[book.id], book.id
+        if key == "author":
+            return self.__author_keys[book.id], book.id
+        return book.year, book.id
+
+    def __view_remove(self, key, entry):
+        view = self.__views[key]
+        i = bisect_left(view, entry)
+        if i < len(view) and view[i] == entry:
+            del view[i]
+
+    @staticmethod
+    def __discard(index, key, book_id):
+        bucket = index.get(key)
+        if bucket is not None:
+            if isinstance(bucket, set):
+                bucket.discard(book_id)
+            else:
+                bucket.pop(book_id, None)
+            if not bucket:
+                del index[key]
+
+    def _book_changed(self, book, field, old):
+        # იძახებს Book-ის setter-ები რედაქტირებისას
+        self.__log({"op": "edit", "id": book.id, "field": field,
+                    "value": getattr(book, field)})
+        if field == "title":
+            self.__view_remove("title", (self.__title_keys[book.id], book.id))
+            self.__unindex_title(book.id)
+            self.__unindex_text(book.id)
+            self.__title_keys[book.id] = collation_key(book.title)
+            self.__index_title(book.id)
+            self.__index_text(book.id)
+            insort(self.__views["title"], self.__view_entry("title", book))
+        elif field == "author":
+            old_key = self.__author_keys[book.id]
+            self.__view_remove("author", (old_key, book.id))
+            self.__discard(self.__by_author, old_key, book.id)
+            self.__unindex_text(book.id)
+            self.__author_keys[book.id] = collation_key(book.author)
+            self.__by_author.setdefault(self.__author_keys[book.id], {})[book.id] = book
+            self.__index_text(book.id)
+            insort(self.__views["author"], self.__view_entry("author", book))
+        elif field == "year":
+            self.__view_remove("year", (old, book.id))
+            self.__discard(self.__by_year, old, book.id)
+            self.__by_year.setdefault(book.year, {})[book.id] = book
+            self.__count_decade(old, -1)
+            self.__count_decade(book.year, 1)
+            insort(self.__views["year"], self.__view_entry("year", book))
+
+    def __insert(self, book):
+        if book.id in self.__books:
+            raise ValueError(f"წიგნი id-ით {book.id} უკვე არსებობს.")
+        self.__books[book.id] = book
+        self.__index(book)
+        self.__pos[book.id] = self.__seq
+        self.__seq += 1
+        book._manager = self
+
+    def __log_add(self, book):
+        self.__log({"op": "add", "id": book.id, "title": book.title,
+                    "author": book.author, "year": book.year})
 
     # Add
     def add_book(self, book: Book):
-        self.__books.append(book)
+        self.__insert(book)
+        for key in self.SORT_KEYS:
+            insort(self.__views[key], self.__view_entry(key, book))
+        self.__log_add(book)
+
+    def add_books(self, books):
+        # ბევრი წიგნის ერთად დამატება: ხედები ერთხელ ლაგდება და არა ყოველ ჩასმაზე
+        added = []
+        try:
+            for book in books:
+                self.__insert(book)
+                added.append(book)
+        finally:
+            for key in self.SORT_KEYS:
+                view = self.__views[key]
+                view.extend(self.__view_entry(key, b) for b in added)
+                view.sort()
+            # შუა პარტიაში შეცდომისასაც უკვე ჩასმული წიგნები ჟურნალში უნდა მოხვდეს
+            if self.__journal is not None:
+                for book in added:
+                    self.__log_add(book)
+        return len(added)
+
+    # Get
+    def get_book_by_id(self, book_id):
+        return self.__books.get(book_id)
+
+    def find_by_author(self, author):
+        return list(self.__by_author.get(collation_key(author.strip()), {}).values())
+
+    def find_by_year(self, year):
+        return list(self.__by_year.get(int(year), {}).values())
+
+    # Years
+    def __year_bounds(self, start, end):
+        # დალაგებულ წლის ხედში ორობითი ძებნა: [start, end] შუალედის საზღვრები
+        view = self.__views["year"]
+        return bisect_left(view, (start,)), bisect_left(view, (end + 1,))
+
+    def find_by_year_range(self, start, end):
+        # O(log n + k), წლის (და id-ის) რიგით
+        lo, hi = self.__year_bounds(start, end)
+        books = self.__books
+        return [books[book_id] for _, book_id in self.__views["year"][lo:hi]]
+
+    def count_in_year_range(self, start, end):
+        # start > end — ცარიელი შუალედი (hi < lo)
+        lo, hi = self.__year_bounds(start, end)
+        return max(0, hi - lo)
+
+    def count_by_year(self):
+        return {year: len(self.__by_year[year]) for year in sorted(self.__by_year)}
+
+    def count_by_decade(self):
+        return dict(sorted(self.__decades.items()))
+
+    # Update
+    def update_book(self, book_id, title=None, author=None, year=None):
+        book = self.__books.get(book_id)
+        if book is None:
+            return False
+
+        # ჯერ ყველა ველს ვამოწმებთ, რომ ნაწილობრივი განახლება არ მოხდეს
+        if title is not None and not title.strip():
+            raise ValueError("სათაური არ შეიძლება იყოს ცარიელი.")
+        if author is not None:
+            ok, result = validate_author(author)
+            if not ok:
+                raise ValueError(result)
+        if year is not None:
+            ok, result = validate_year(str(year))
+            if not ok:
+                raise ValueError(result)
+
+        if title is not None:
+            book.title = title
+        if author is not None:
+            book.author = author
+        if year is not None:
+            book.year = year
+        return True
+
+    # List
+    def iter_books(self, key=None):
+        # აბრუნებს წიგნებს მოცემული (ან მიმდინარე) რიგით, ხელახალი დალაგების გარეშე
+        key = self.__order if key is None else key
+        if key is None:
+            yield from self.__books.values()
+            return
+        books = self.__books
+        for _, book_id in self.__views[key]:
+            yield books[book_id]
+
+    def iter_pages(self, key=None, page_size=PAGE_SIZE):
+        return paginate(self.iter_books(key), page_size)
 
     # Show
-    def show_books(self):
-        if not self.__books:
+    def show_books(self, stream=None):
+        if not write_listing(self.iter_books(), stream):
             print("!!! სია ცარიელია.")
-            return
-        for i, book in enumerate(self.__books, start=1):
-            print(f"{i}. {book}")
 
     # Sort
     def sort_books(self, key):
-        if key == "title":
-            self.__books.sort(key=lambda b: b.title.lower())
-        elif key == "author":
-            self.__books.sort(key=lambda b: b.author.lower())
-        elif key == "year":
-            self.__books.sort(key=lambda b: b.year)
+        # ხედები უკვე დალაგებულია — ვცვლით მხოლოდ მიმდინარე რიგს
+        if key in self.__views:
+            self.__order = key
 
     # Search
     def search_by_title(self, query):
-        query = query.lower()
-        return [b for b in self.__books if query in b.title.lower()]
+        query = collation_key(query)
+        if not query:
+            return list(self.iter_books())
+
+        if len(query) < NGRAM:
+            # ერთი-ორი ასო ტრიგრამას არ შეიცავს — ქეშირებული გასაღებების გადარჩევა
+            ids = [i for i, key in self.__title_keys.items() if query in key]
+        else:
+            if self.__grams is None:
+                self.__grams = {}
+                for book_id in self.__title_keys:
+                    self.__index_title(book_id)
+            # ვკვეთთ ტრიგრამების სიებს უმცირესიდან დაწყებული და ვამოწმებთ
+            postings = sorted(
+                (self.__grams.get(g, ()) for g in title_ngrams(query)),
+                key=len,
+            )
+            candidates = set(postings[0])
+            for p in postings[1:]:
+                if not candidates:
+                    break
+                candidates.intersection_update(p)
+            ids = [i for i in candidates if query in self.__title_keys[i]]
+
+        books = [self.__books[i] for i in ids]
+        books.sort(key=self.__order_key)
+        return books
+
+    def __order_key(self, book):
+        # წიგნის ადგილი მიმდინარე სიის რიგში
+        if self.__order is None:
+            return self.__pos[book.id]
+        return self.__view_entry(self.__order, book)
+
+    def fuzzy_search(self, query, max_distance=2, limit=20):
+        # მოთხოვნის ყოველ სიტყვას უნდა შეესაბამებოდეს წიგნის სათაურის ან ავტორის
+        # სიტყვა; მანძილი = სიტყვების მანძილების ჯამი <= max_distance.
+        # აბრუნებს [(მანძილი, Book), ...] მანძილის მიხედვით დალაგებულს
+        tokens = words(collation_key(query))
+        if not tokens:
+            return []
+        # ინდექსი max_distance-ზე მეტ მანძილს ვერ პოულობს — უფრო დიდი მოთხოვნისას თავიდან ვაგებთ
+        if self.__fuzzy is None or max_distance > self.__fuzzy.max_distance:
+            self.__fuzzy = DeletionIndex(max_distance=max(2, max_distance))
+            for book_id in self.__title_keys:
+                for term in self.__fuzzy_terms(book_id):
+                    self.__fuzzy.add(term, book_id)
+
+        best = None
+        for token in tokens:
+            matches = {}
+            for d, _, ids in self.__fuzzy.search(token, max_distance):
+                for book_id in ids:
+                    if d < matches.get(book_id, max_distance + 1):
+                        matches[book_id] = d
+            if best is None:
+                best = matches
+            else:
+                best = {book_id: d + matches[book_id] for book_id, d in best.items()
+                        if book_id in matches and d + matches[book_id] <= max_distance}
+            if not best:
+                return []
+
+        ranked = sorted(
+            ((d, self.__books[book_id]) for book_id, d in best.items()),
+            key=lambda item: (item[0], self.__order_key(item[1])),
+        )
+        return ranked[:limit] if limit else ranked
+
+    # Duplicates
+    def find_duplicates(self, threshold=0.5):
+        # სავარაუდო დუბლიკატების ჯგუფები (სათაური + ავტორი, MinHash-ით შეფასებული
+        # ჟაკარის მსგავსება >= threshold); ჯგუფები დალაგებულია id-ით
+        if self.__lsh is None:
+            self.__lsh = MinHashLSH()
+            for book_id in self.__title_keys:
+                self.__lsh.add(book_id, self.__dedup_text(book_id))
+        clusters = [sorted(group) for group in self.__lsh.clusters(threshold)]
+        clusters.sort()
+        return [[self.__books[book_id] for book_id in group] for group in clusters]
 
     # Delete
     def delete_book_by_id(self, book_id):
-        for b in self.__books:
-            if b.id == book_id:
-                self.__books.remove(b)
-                return True
-        return False
+        book = self.__books.pop(book_id, None)
+        if book is None:
+            return False
+        self.__unindex(book)
+        del self.__pos[book_id]
+        book._manager = None
+        self.__log({"op": "delete", "id": book_id})
+        return True
+
+    # ----- ჟურნალი -----
+    def __log(self, record):
+        journal = self.__journal
+        if journal is None:
+            return
+        journal.append(record)
+        if journal.needs_compaction(len(self.__books)):
+            self.compact()
+
+    def __apply(self, record):
+        # ჟურნალის ჩანაწერის აღდგენა; განმეორებით გამოყენება უსაფრთხოა
+        op, book_id = record["op"], record["id"]
+        book = self.__books.get(book_id)
+        if op == "add":
+            if book is None:
+                self.add_book(Book.restore(book_id, record["title"], record["author"],
+                                           record["year"]))
+            else:
+                self.update_book(book_id, record["title"], record["author"], record["year"])
+        elif op == "edit" and book is not None:
+            setattr(book, record["field"], record["value"])
+        elif op == "delete":
+            self.delete_book_by_id(book_id)
+        return book_id
+
+    def open_journal(self, filename="books.json", **options):
+        # snapshot + ჟურნალის კუდის აღდგენა, შემდეგ ყოველი ცვლილება ჟურნალში იწერება
+        self.close_journal()
+        if filename.endswith(".jsonl"):
+            self.load_trusted(filename)
+        else:
+            self.load_from_file(filename)
+        journal = BookJournal(filename, **options)
+        max_id = Book.next_id - 1
+        for record in journal.replay():
+            max_id = max(max_id, self.__apply(record))
+        Book.next_id = max_id + 1
+        journal.open()
+        self.__journal = journal
+
+    def compact(self):
+        # ახალი snapshot ატომურად ანაცვლებს ძველს, ჟურნალი კი სუფთავდება
+        journal = self.__journal
+        if journal is None:
+            return
+        journal.sync()
+        if journal.filename.endswith(".jsonl"):
+            self.save_trusted(journal.filename)
+        else:
+            self.save_to_file(journal.filename)
+        journal.truncate()
+
+    def close_journal(self):
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+
+    def close(self):
+        self.close_journal()
 
     # Save
     def save_to_file(self, filename="books.json"):
         data = [
             {"id": b.id, "title": b.title, "author": b.author, "year": b.year}
-            for b in self.__books
+            for b in self.__books.values()
         ]
-        with open(filename, "w", encoding="utf-8") as f:
+        # ჯერ დროებით ფაილში, შემდეგ ატომური ჩანაცვლება — ავარიისას ძველი ფაილი რჩება
+        tmp = filename + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
 
     # Load
     def load_from_file(self, filename="books.json"):
@@ -148,27 +914,1058 @@ class BookManager:
             with open(filename, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
-            self.__books = []
+            self.__clear()
 
-            for item in data:
-                book = Book(item["title"], item["author"], item["year"])
-                # ვაბრუნებთ რეალურ id-ს
-                book._Book__id = item["id"]
-                self.add_book(book)
+            # ჩატვირთვა ჟურნალში არ იწერება; ჟურნალის რეჟიმში ახალი snapshot იქმნება
+            journal, self.__journal = self.__journal, None
+            self.add_books(
+                Book.restore(item["id"], item["title"], item["author"], item["year"])
+                for item in data
+            )
+            self.__journal = journal
 
-            Book.next_id = max((b.id for b in self.__books), default=0) + 1
+            Book.next_id = max(self.__books, default=0) + 1
+            self.compact()
 
             print("ფაილი ჩატვირთულია.")
         except FileNotFoundError:
             print("ფაილი არ არსებობს — შეიქმნება ახალი.")
 
+    # Trusted save / load
+    def save_trusted(self, filename="books.jsonl"):
+        write_trusted(filename, self.__books.values(), len(self.__books))
+
+    def load_trusted(self, filename="books.jsonl"):
+        # ნაკადური ჩატვირთვა ვალიდაციის გარეშე; საკონტროლო ჯამი მოწმდება ბოლოს,
+        # ამიტომ დაზიანებული ფაილი მიმდინარე კატალოგს არ ცვლის
+        start = time.perf_counter()
+        trusted = Book.trusted
+        try:
+            books = [trusted(*record) for record in read_trusted(filename)]
+        except FileNotFoundError:
+            print("ფაილი არ არსებობს — შეიქმნება ახალი.")
+            return 0
+
+        self.__clear()
+        journal, self.__journal = self.__journal, None
+        self.add_books(books)
+        self.__journal = journal
+        Book.next_id = max(self.__books, default=0) + 1
+        self.compact()
+
+        elapsed = time.perf_counter() - start
+        rate = len(books) / elapsed if elapsed else 0
+        print(f"ჩატვირთულია {len(books)} ჩანაწერი {elapsed:.2f} წმ-ში ({rate:,.0f} ჩანაწ./წმ).")
+        return len(books)
+
+
+# ============================
+#       COLUMNAR STORE
+# ============================
+class BookView:
+    # Book-ის ინტერფეისის მქონე თხელი ხედი BookColumns-ის ერთ სტრიქონზე. setter-ები
+    # პირდაპირ სვეტებში წერს — ColumnarBookManager-ში სვეტები კატალოგის ერთადერთი საცავია
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns, row):
+        self._columns = columns
+        self._row = row
+
+    @property
+    def id(self):
+        return self._columns.ids[self._row]
+
+    @property
+    def title(self):
+        return self._columns.titles[self._columns.title_refs[self._row]]
+
+    @title.setter
+    def title(self, value):
+        self._columns.update(self._row, title=value)
+
+    @property
+    def author(self):
+        return self._columns.authors[self._columns.author_refs[self._row]]
+
+    @author.setter
+    def author(self, value):
+        self._columns.update(self._row, author=value)
+
+    @property
+    def year(self):
+        return self._columns.years[self._row]
+
+    @year.setter
+    def year(self, value):
+        self._columns.update(self._row, year=value)
+
+    __str__ = Book.__str__
+
+
+class StringTable:
+    # სტრიქონები ერთ UTF-8 ბლოკში, თითო str ობიექტის გარეშე.
+    # intern=True — ერთნაირი სტრიქონი ერთხელ ინახება (ავტორებისთვის)
+    def __init__(self, intern=False):
+        self.__blob = bytearray()
+        self.__offsets = array("Q", [0])
+        self.__table = {} if intern else None
+
+    def __len__(self):
+        return len(self.__offsets) - 1
+
+    def __getitem__(self, ref):
+        return self.__blob[self.__offsets[ref]:self.__offsets[ref + 1]].decode("utf-8")
+
+    def add(self, value):
+        table = self.__table
+        if table is not None:
+            ref = table.get(value)
+            if ref is not None:
+                return ref
+        ref = len(self.__offsets) - 1
+        self.__blob += value.encode("utf-8")
+        self.__offsets.append(len(self.__blob))
+        if table is not None:
+            table[value] = ref
+        return ref
+
+
+class BookColumns:
+    # სვეტური შენახვა: id და წელი — array-ებში, სათაური და ავტორი — StringTable-ის
+    # ინდექსებად. Book-ები არ ინახება — BookView იქმნება მოთხოვნისას.
+    # სტრიქონის ნომერი არასოდეს იცვლება: წაშლილი სტრიქონი მხოლოდ ინიშნება, შეცვლილი
+    # სათაური ბლოკის ბოლოს ემატება. ორივე ნარჩენი ქრება ფაილში ჩაწერისა და ხელახალი ჩატვირთვისას
+    def __init__(self):
+        self.ids = array("I")
+        self.years = array("H")
+        self.title_refs = array("I")
+        self.author_refs = array("I")
+        self.titles = StringTable()
+        self.authors = StringTable(intern=True)
+        # წაშლილი სტრიქონები
+        self.deleted = set()
+        # ცოცხალი სტრიქონები id-ის რიგით — id-ით ძებნა ორობითია
+        self.__by_id = array("I")
+        # key -> სტრიქონების ნომრები დალაგებული რიგით (ქეში)
+        self.__orders = {}
+        # ცვლილებების მთვლელი: მენეჯერი ამით იგებს, საჭიროა თუ არა შენახვა
+        self.version = 0
+
+    def __len__(self):
+        return len(self.ids) - len(self.deleted)
+
+    def __getitem__(self, row):
+        if not 0 <= row < len(self.ids) or row in self.deleted:
+            raise IndexError(row)
+        return BookView(self, row)
+
+    def __iter__(self):
+        return self.iter_books()
+
+    def row_of(self, book_id):
+        # სტრიქონის ნომერი id-ით ან None
+        rows = self.__by_id
+        i = bisect_left(rows, book_id, key=self.ids.__getitem__)
+        if i < len(rows) and self.ids[rows[i]] == book_id:
+            return rows[i]
+        return None
+
+    def append(self, book_id, title, author, year):
+        ids, rows = self.ids, self.__by_id
+        # ჩვეულებრივ id-ები ზრდადია — მაშინ დუბლიკატის შემოწმება და ჩასმა O(1)-ია
+        in_order = not rows or ids[rows[-1]] < book_id
+        if not in_order and self.row_of(book_id) is not None:
+            raise ValueError(f"წიგნი id-ით {book_id} უკვე არსებობს.")
+        row = len(ids)
+        ids.append(book_id)
+        self.years.append(year)
+        self.title_refs.append(self.titles.add(title))
+        self.author_refs.append(self.authors.add(author))
+        if in_order:
+            rows.append(row)
+        else:
+            insort(rows, row, key=ids.__getitem__)
+        self.__changed()
+        return row
+
+    def __live(self, row):
+        if not 0 <= row < len(self.ids) or row in self.deleted:
+            raise ValueError("წიგნი წაშლილია ან არ არსებობს.")
+
+    def update(self, row, title=None, author=None, year=None):
+        # ჯერ ყველა ველს ვამოწმებთ (როგორც BookManager.update_book), შემდეგ ვწერთ
+        self.__live(row)
+        if title is not None:
+            title = title.strip()
+            if not title:
+                raise ValueError("სათაური არ შეიძლება იყოს ცარიელი.")
+        if author is not None:
+            ok, author = validate_author(author)
+            if not ok:
+                raise ValueError(author)
+        if year is not None:
+            ok, year = validate_year(str(year))
+            if not ok:
+                raise ValueError(year)
+
+        if title is not None:
+            self.title_refs[row] = self.titles.add(title)
+        if author is not None:
+            self.author_refs[row] = self.authors.add(author)
+        if year is not None:
+            self.years[row] = year
+        self.__changed()
+
+    def delete(self, row):
+        self.__live(row)
+        rows = self.__by_id
+        del rows[bisect_left(rows, self.ids[row], key=self.ids.__getitem__)]
+        self.deleted.add(row)
+        self.__changed()
+
+    def __changed(self):
+        self.__orders.clear()
+        self.version += 1
+
+    @classmethod
+    def from_books(cls, books):
+        columns = cls()
+        for b in books:
+            columns.append(b.id, b.title, b.author, b.year)
+        return columns
+
+    @classmethod
+    def load_trusted(cls, filename="books.jsonl"):
+        # სანდო ფაილის პირდაპირ სვეტებში ჩატვირთვა, Book ობიექტების შექმნის გარეშე
+        columns = cls()
+        append = columns.append
+        for record in read_trusted(filename):
+            append(*record)
+        return columns
+
+    def order(self, key=None):
+        # ცოცხალი სტრიქონების ნომრები: key=None — ჩასმის რიგით, სხვა შემთხვევაში
+        # title/author/year რიგით; collation გასაღები ითვლება თითო უნიკალურ
+        # სტრიქონზე და არა თითო ჩანაწერზე
+        rows = self.__orders.get(key)
+        if rows is None:
+            deleted = self.deleted
+            rows = [row for row in range(len(self.ids)) if row not in deleted]
+            if key is not None:
+                # ჯერ id-ით (თანაბარი გასაღებისთვის), შემდეგ სტაბილურად მთავარი გასაღებით
+                rows.sort(key=self.ids.__getitem__)
+            if key == "year":
+                rows.sort(key=self.years.__getitem__)
+            elif key is not None:
+                strings, refs = ((self.titles, self.title_refs) if key == "title"
+                                 else (self.authors, self.author_refs))
+                rank = array("I", bytes(4 * len(strings)))
+                for r, i in enumerate(sorted(range(len(strings)),
+                                             key=lambda i: collation_key(strings[i]))):
+                    rank[i] = r
+                rows.sort(key=lambda row: rank[refs[row]])
+            rows = self.__orders[key] = array("I", rows)
+        return rows
+
+    def iter_books(self, key=None):
+        return (BookView(self, row) for row in self.order(key))
+
+    def search_titles(self, query, key=None):
+        # query — collation გასაღები; სათაურების გადარჩევა მოცემული რიგით
+        titles, refs = self.titles, self.title_refs
+        return [BookView(self, row) for row in self.order(key)
+                if query in collation_key(titles[refs[row]])]
+
+    def find_by_year_range(self, start, end):
+        # წლის რიგში ორობითი ძებნა: O(log n + k)
+        rows = self.order("year")
+        years = self.years
+        lo = bisect_left(rows, start, key=years.__getitem__)
+        hi = bisect_right(rows, end, key=years.__getitem__)
+        return [BookView(self, row) for row in rows[lo:hi]]
+
+
+class ColumnarBookManager:
+    # BookManager-ის ინტერფეისი, სადაც კატალოგის ერთადერთი საცავი BookColumns-ია:
+    # Book ობიექტები არ ინახება, ყველა მეთოდი BookView-ებს აბრუნებს. კატალოგი
+    # იტვირთება სანდო .jsonl ფაილიდან და compact()/close()-ზე მთლიანად გადაიწერება
+    SORT_KEYS = BookManager.SORT_KEYS
+
+    def __init__(self, filename="books.jsonl"):
+        self.__filename = filename
+        try:
+            self.__columns = BookColumns.load_trusted(filename)
+        except FileNotFoundError:
+            print("ფაილი არ არსებობს — შეიქმნება ახალი.")
+            self.__columns = BookColumns()
+        self.__saved = self.__columns.version
+        # მიმდინარე სიის რიგი (None — დამატების რიგი)
+        self.__order = None
+        if self.__columns.ids:
+            Book.next_id = max(Book.next_id, max(self.__columns.ids) + 1)
+
+    def __len__(self):
+        return len(self.__columns)
+
+    # Add
+    def add_book(self, book: Book):
+        # Book-იდან მხოლოდ ველები გადაიწერება სვეტებში; შემდგომ წიგნი BookView-ით ჩანს
+        self.__columns.append(book.id, book.title, book.author, book.year)
+
+    def add_books(self, books):
+        count = 0
+        for book in books:
+            self.add_book(book)
+            count += 1
+        return count
+
+    # Get
+    def get_book_by_id(self, book_id):
+        row = self.__columns.row_of(book_id)
+        return None if row is None else BookView(self.__columns, row)
+
+    def find_by_author(self, author):
+        author = collation_key(author.strip())
+        columns = self.__columns
+        refs = {ref for ref in range(len(columns.authors))
+                if collation_key(columns.authors[ref]) == author}
+        return [b for b in columns.iter_books() if columns.author_refs[b._row] in refs]
+
+    def find_by_year(self, year):
+        return self.find_by_year_range(int(year), int(year))
+
+    # Years
+    def find_by_year_range(self, start, end):
+        return self.__columns.find_by_year_range(start, end)
+
+    def count_in_year_range(self, start, end):
+        return len(self.__columns.find_by_year_range(start, end))
+
+    def count_by_year(self):
+        counts = {}
+        years = self.__columns.years
+        for row in self.__columns.order("year"):
+            counts[years[row]] = counts.get(years[row], 0) + 1
+        return counts
+
+    def count_by_decade(self):
+        counts = {}
+        for year, count in self.count_by_year().items():
+            decade = year - year % 10
+            counts[decade] = counts.get(decade, 0) + count
+        return counts
+
+    # Update
+    def update_book(self, book_id, title=None, author=None, year=None):
+        row = self.__columns.row_of(book_id)
+        if row is None:
+            return False
+        self.__columns.update(row, title, author, year)
+        return True
+
+    # Delete
+    def delete_book_by_id(self, book_id):
+        row = self.__columns.row_of(book_id)
+        if row is None:
+            return False
+        self.__columns.delete(row)
+        return True
+
+    # List
+    def iter_books(self, key=None):
+        return self.__columns.iter_books(self.__order if key is None else key)
+
+    def list_books(self, key=None, offset=0, limit=PAGE_SIZE):
+        return list(islice(self.iter_books(key), offset, offset + limit))
+
+    def iter_pages(self, key=None, page_size=PAGE_SIZE):
+        return paginate(self.iter_books(key), page_size)
+
+    # Show
+    def show_books(self, stream=None):
+        if not write_listing(self.iter_books(), stream):
+            print("!!! სია ცარიელია.")
+
+    # Sort
+    def sort_books(self, key):
+        if key in self.SORT_KEYS:
+            self.__order = key
+
+    # Search
+    def search_by_title(self, query):
+        # ინდექსის გარეშე: მეხსიერების რეჟიმია, ძიება სათაურების გადარჩევაა
+        query = collation_key(query)
+        if not query:
+            return list(self.iter_books())
+        return self.__columns.search_titles(query, self.__order)
+
+    # Save
+    def compact(self):
+        columns = self.__columns
+        if columns.version != self.__saved:
+            write_trusted(self.__filename, columns.iter_books(), len(columns))
+            self.__saved = columns.version
+
+    def close(self):
+        self.compact()
+
+
+# ============================
+#       SQLITE BACKEND
+# ============================
+class SQLiteBookManager:
+    # BookManager-ის ინტერფეისი, სადაც მონაცემები და ინდექსები SQLite-შია
+    SORT_COLUMNS = {"title": "title_key, id", "author": "author_key, id", "year": "year, id"}
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS books (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            title_key TEXT NOT NULL,
+            author_key TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS books_title ON books (title_key, id);
+        CREATE INDEX IF NOT EXISTS books_author ON books (author_key, id);
+        CREATE INDEX IF NOT EXISTS books_year ON books (year, id);
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5 (
+            title_key, content='books', content_rowid='id',
+            tokenize='trigram case_sensitive 1'
+        );
+        CREATE TRIGGER IF NOT EXISTS books_ai AFTER INSERT ON books BEGIN
+            INSERT INTO books_fts (rowid, title_key) VALUES (new.id, new.title_key);
+        END;
+        CREATE TRIGGER IF NOT EXISTS books_ad AFTER DELETE ON books BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title_key)
+                VALUES ('delete', old.id, old.title_key);
+        END;
+        CREATE TRIGGER IF NOT EXISTS books_au AFTER UPDATE OF title_key ON books BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title_key)
+                VALUES ('delete', old.id, old.title_key);
+            INSERT INTO books_fts (rowid, title_key) VALUES (new.id, new.title_key);
+        END;
+    """
+
+    def __init__(self, filename="books.db"):
+        self.filename = filename
+        self.__db = sqlite3.connect(filename)
+        self.__db.execute("PRAGMA journal_mode=WAL")
+        self.__db.execute("PRAGMA synchronous=NORMAL")
+        self.__db.executescript(self.SCHEMA)
+        self.__order = None
+        self.__sync_next_id()
+
+    def __sync_next_id(self):
+        (max_id,) = self.__db.execute("SELECT COALESCE(MAX(id), 0) FROM books").fetchone()
+        Book.next_id = max(Book.next_id, max_id + 1)
+
+    def __book(self, row):
+        book = Book.restore(*row)
+        book._manager = self
+        return book
+
+    def __query(self, where="", params=(), key=None):
+        key = self.__order if key is None else key
+        order = self.SORT_COLUMNS.get(key, "id")
+        sql = f"SELECT id, title, author, year FROM books {where} ORDER BY {order}"
+        return (self.__book(row) for row in self.__db.execute(sql, params))
+
+    def _book_changed(self, book, field, old):
+        # იძახებს Book-ის setter-ები რედაქტირებისას
+        value = getattr(book, field)
+        with self.__db:
+            if field == "title":
+                self.__db.execute("UPDATE books SET title = ?, title_key = ? WHERE id = ?",
+                                  (value, collation_key(value), book.id))
+            elif field == "author":
+                self.__db.execute("UPDATE books SET author = ?, author_key = ? WHERE id = ?",
+                                  (value, collation_key(value), book.id))
+            elif field == "year":
+                self.__db.execute("UPDATE books SET year = ? WHERE id = ?", (value, book.id))
+
+    def __insert(self, books):
+        self.__db.executemany(
+            "INSERT INTO books (id, title, author, year, title_key, author_key) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ((b.id, b.title, b.author, b.year, collation_key(b.title), collation_key(b.author))
+             for b in books),
+        )
+
+    # Add
+    def add_book(self, book: Book):
+        try:
+            with self.__db:
+                self.__insert((book,))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"წიგნი id-ით {book.id} უკვე არსებობს.") from None
+        book._manager = self
+
+    def add_books(self, books):
+        books = list(books)
+        try:
+            with self.__db:
+                self.__insert(books)
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"წიგნების დამატება ვერ მოხერხდა: {e}") from None
+        for book in books:
+            book._manager = self
+        return len(books)
+
+    # Get
+    def get_book_by_id(self, book_id):
+        return next(self.__query("WHERE id = ?", (book_id,)), None)
+
+    def find_by_author(self, author):
+        return list(self.__query("WHERE author_key = ?", (collation_key(author.strip()),), "id"))
+
+    def find_by_year(self, year):
+        return list(self.__query("WHERE year = ?", (int(year),), "id"))
+
+    # Years
+    def find_by_year_range(self, start, end):
+        return list(self.__query("WHERE year BETWEEN ? AND ?", (start, end), "year"))
+
+    def count_in_year_range(self, start, end):
+        (count,) = self.__db.execute(
+            "SELECT COUNT(*) FROM books WHERE year BETWEEN ? AND ?", (start, end)).fetchone()
+        return count
+
+    def count_by_year(self):
+        return dict(self.__db.execute(
+            "SELECT year, COUNT(*) FROM books GROUP BY year ORDER BY year"))
+
+    def count_by_decade(self):
+        return dict(self.__db.execute(
+            "SELECT year - year % 10 AS decade, COUNT(*) FROM books GROUP BY decade ORDER BY decade"))
+
+    # Update
+    def update_book(self, book_id, title=None, author=None, year=None):
+        book = self.get_book_by_id(book_id)
+        if book is None:
+            return False
+        if title is not None and not title.strip():
+            raise ValueError("სათაური არ შეიძლება იყოს ცარიელი.")
+        for validate, value in ((validate_author, author), (validate_year, year)):
+            if value is not None:
+                ok, result = validate(str(value))
+                if not ok:
+                    raise ValueError(result)
+
+        if title is not None:
+            book.title = title
+        if author is not None:
+            book.author = author
+        if year is not None:
+            book.year = year
+        return True
+
+    # List
+    def iter_books(self, key=None):
+        return self.__query(key=key)
+
+    def iter_pages(self, key=None, page_size=PAGE_SIZE):
+        return paginate(self.iter_books(key), page_size)
+
+    # Show
+    def show_books(self, stream=None):
+        if not write_listing(self.iter_books(), stream):
+            print("!!! სია ცარიელია.")
+
+    # Sort
+    def sort_books(self, key):
+        if key in self.SORT_COLUMNS:
+            self.__order = key
+
+    # Search
+    def search_by_title(self, query):
+        query = collation_key(query)
+        if len(query) >= 3:
+            # trigram FTS5 ინდექსი ქვესტრიქონის ძიებისთვის
+            phrase = '"' + query.replace('"', '""') + '"'
+            return list(self.__query(
+                "WHERE id IN (SELECT rowid FROM books_fts WHERE books_fts MATCH ?)", (phrase,)))
+        # ტრიგრამზე მოკლე მოთხოვნას FTS5 ვერ ემსახურება
+        return list(self.__query("WHERE instr(title_key, ?) > 0", (query,)))
+
+    # Delete
+    def delete_book_by_id(self, book_id):
+        with self.__db:
+            cursor = self.__db.execute("DELETE FROM books WHERE id = ?", (book_id,))
+        return cursor.rowcount > 0
+
+    # Migration
+    def migrate_from_json(self, filename="books.json", batch_size=10000):
+        # books.json-ის ერთჯერადი გადატანა ბაზაში ერთ ტრანზაქციაში; არაცარიელ
+        # ბაზაში გადატანა უარყოფილია, რომ განმეორებით გაშვებამ id-ები არ შეაჯახოს
+        (count,) = self.__db.execute("SELECT COUNT(*) FROM books").fetchone()
+        if count:
+            raise ValueError(f"ბაზა უკვე შეიცავს {count} წიგნს — გადატანა მხოლოდ ცარიელ ბაზაში შეიძლება.")
+        with open(filename, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        try:
+            with self.__db:
+                for start in range(0, len(data), batch_size):
+                    self.__insert(
+                        Book.restore(item["id"], item["title"], item["author"], item["year"])
+                        for item in data[start:start + batch_size]
+                    )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"გადატანა ვერ მოხერხდა: {e}") from None
+        self.__sync_next_id()
+        return len(data)
+
+    def compact(self):
+        self.__db.commit()
+        self.__db.execute("PRAGMA optimize")
+
+    def close(self):
+        self.__db.close()
+
+
+# ============================
+#       BULK IMPORT
+# ============================
+IMPORT_FIELDS = ("title", "author", "year")
+
+
+def validate_rows(rows):
+    # მუშა პროცესში სრულდება: [(ხაზი, title, author, year), ...] ->
+    # (მიღებული [(title, author, year)], უარყოფილი [(ხაზი, მიზეზი)])
+    accepted, rejected = [], []
+    for line_no, title, author, year in rows:
+        title = title.strip()
+        if not title:
+            rejected.append((line_no, "სათაური არ შეიძლება იყოს ცარიელი."))
+            continue
+        ok, author = validate_author(author)
+        if not ok:
+            rejected.append((line_no, author))
+            continue
+        ok, year = validate_year(year)
+        if not ok:
+            rejected.append((line_no, year))
+            continue
+        accepted.append((title, author, year))
+    return accepted, rejected
+
+
+def read_catalog_rows(filename, chunk_size, rejected):
+    # CSV (სათაურის ხაზით title,author,year) ან JSONL ფაილის ნაკადური კითხვა
+    # ნაწილებად; გაუმართავი სტრიქონები პირდაპირ rejected-ში ხვდება
+    chunk = []
+    with open(filename, "r", encoding="utf-8", newline="") as f:
+        if filename.endswith(".csv"):
+            reader = csv.DictReader(f)
+            missing = set(IMPORT_FIELDS) - set(reader.fieldnames or ())
+            if missing:
+                raise ValueError(f"{filename}: აკლია სვეტები: {', '.join(sorted(missing))}")
+            records = ((reader.line_num, row) for row in reader)
+        else:
+            records = enumerate(f, start=1)
+
+        for line_no, record in records:
+            if isinstance(record, str):
+                if not record.strip():
+                    continue
+                try:
+                    record = json.loads(record)
+                except json.JSONDecodeError:
+                    rejected.append((line_no, "გაუმართავი JSON."))
+                    continue
+            if not isinstance(record, dict) or any(record.get(k) is None for k in IMPORT_FIELDS):
+                rejected.append((line_no, "აკლია title/author/year ველი."))
+                continue
+            chunk.append((line_no, str(record["title"]), str(record["author"]), str(record["year"])))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_catalog(manager, filename, workers=None, chunk_size=5000, report=None):
+    # ვალიდაცია ProcessPoolExecutor-ში, მიღებული სტრიქონები id-ებს ერთად იღებენ
+    # და მენეჯერში ნაწილ-ნაწილ იწერება; უარყოფილები report ფაილში (CSV) ან სიაში
+    start = time.perf_counter()
+    rejected = []
+    accepted_total = rejected_total = counted = 0
+    report_file = open(report, "w", encoding="utf-8", newline="") if report else None
+    report_writer = csv.writer(report_file) if report_file else None
+    if report_writer:
+        report_writer.writerow(("line", "reason"))
+
+    def flush_rejected():
+        nonlocal rejected_total, counted
+        rejected_total += len(rejected) - counted
+        if report_writer:
+            report_writer.writerows(rejected)
+            rejected.clear()
+        counted = len(rejected)
+
+    def store(result):
+        nonlocal accepted_total
+        accepted, chunk_rejected = result
+        first_id = Book.next_id
+        Book.next_id += len(accepted)
+        manager.add_books(
+            Book.trusted(first_id + i, title, author, year)
+            for i, (title, author, year) in enumerate(accepted)
+        )
+        accepted_total += len(accepted)
+        rejected.extend(chunk_rejected)
+        flush_rejected()
+        # rejected_total უკვე შეიცავს კითხვისას უარყოფილ სტრიქონებსაც (JSON, ველები)
+        processed = accepted_total + rejected_total
+        elapsed = time.perf_counter() - start
+        print(f"  {processed:,} სტრიქონი, {processed / elapsed:,.0f} სტრ./წმ", flush=True)
+
+    try:
+        chunks = read_catalog_rows(filename, chunk_size, rejected)
+        if workers == 1:
+            for chunk in chunks:
+                store(validate_rows(chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # შეზღუდული რაოდენობის ნაწილი ერთდროულად — მეხსიერება არ იზრდება ფაილთან ერთად
+                pending = deque()
+                limit = 2 * (workers or os.cpu_count() or 1)
+                for chunk in chunks:
+                    pending.append(pool.submit(validate_rows, chunk))
+                    if len(pending) >= limit:
+                        store(pending.popleft().result())
+                while pending:
+                    store(pending.popleft().result())
+        flush_rejected()
+    finally:
+        if report_file:
+            report_file.close()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "accepted": accepted_total,
+        "rejected": rejected_total,
+        "seconds": elapsed,
+        "rate": (accepted_total + rejected_total) / elapsed if elapsed else 0,
+    }
+    if not report_writer:
+        summary["rejections"] = rejected
+    print(f"დამატებულია {accepted_total:,}, უარყოფილია {rejected_total:,} "
+          f"({elapsed:.2f} წმ, {summary['rate']:,.0f} სტრ./წმ).")
+    return summary
+
+
+# ============================
+#     CONCURRENT ACCESS
+# ============================
+class RWLock:
+    # ბევრი ერთდროული წამკითხველი ან ერთი ჩამწერი; მომლოდინე ჩამწერი ახალ
+    # წამკითხველებს აჩერებს, რომ ძიებების ნაკადმა ცვლილებები არ დააშივოს.
+    # ბლოკის მფლობელ ნაკადში ჩადგმული read()/write() თავისუფლად გადის
+    # (BookManager-ის მეთოდები ერთმანეთს იძახებენ); read-იდან write-ზე გადასვლა აკრძალულია
+    def __init__(self):
+        self.__cond = threading.Condition()
+        self.__readers = 0
+        self.__writer = None
+        self.__waiting = 0
+        self.__local = threading.local()
+
+    def __depth(self):
+        return getattr(self.__local, "depth", 0)
+
+    @contextmanager
+    def __nested(self):
+        self.__local.depth += 1
+        try:
+            yield
+        finally:
+            self.__local.depth -= 1
+
+    @contextmanager
+    def read(self):
+        if self.__depth():
+            with self.__nested():
+                yield
+            return
+        with self.__cond:
+            while self.__writer is not None or self.__waiting:
+                self.__cond.wait()
+            self.__readers += 1
+        self.__local.depth = 1
+        try:
+            yield
+        finally:
+            self.__local.depth = 0
+            with self.__cond:
+                self.__readers -= 1
+                if not self.__readers:
+                    self.__cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        me = threading.get_ident()
+        if self.__depth():
+            if self.__writer != me:
+                raise RuntimeError("წაკითხვის ბლოკიდან ჩაწერის ბლოკზე გადასვლა შეუძლებელია.")
+            with self.__nested():
+                yield
+            return
+        with self.__cond:
+            self.__waiting += 1
+            while self.__writer is not None or self.__readers:
+                self.__cond.wait()
+            self.__waiting -= 1
+            self.__writer = me
+        self.__local.depth = 1
+        try:
+            yield
+        finally:
+            self.__local.depth = 0
+            with self.__cond:
+                self.__writer = None
+                self.__cond.notify_all()
+
+
+class ConcurrentBookManager(BookManager):
+    # BookManager რამდენიმე ნაკადისთვის: კითხვა პარალელურად, ცვლილებები რიგრიგობით.
+    # წიგნის რედაქტირება მხოლოდ update_book-ით — Book-ის setter-ები ბლოკს არ იღებენ
+    def __init__(self):
+        self._lock = RWLock()
+        # ზარმაცი ინდექსები, რომლებიც უკვე აგებულია; აგება ჩაწერის ბლოკით ხდება
+        self.__ready = set()
+        super().__init__()
+
+    def __read(self, method, *args):
+        with self._lock.read():
+            return method(*args)
+
+    def __write(self, method, *args, reset=False):
+        with self._lock.write():
+            # ჩატვირთვა ყველა ზარმაც ინდექსს თავიდან ააგებინებს
+            if reset:
+                self.__ready.clear()
+            return method(*args)
+
+    def __lazy(self, name, method, *args):
+        if name in self.__ready:
+            with self._lock.read():
+                # ხელახლა ვამოწმებთ — ჩამწერს შეიძლება ინდექსი გაეუქმებინა
+                if name in self.__ready:
+                    return method(*args)
+        with self._lock.write():
+            result = method(*args)
+            self.__ready.add(name)
+            return result
+
+    def create_book(self, title, author, year):
+        # Book.next_id-ის გაზრდაც ჩაწერის ბლოკის ქვეშ უნდა მოხდეს
+        with self._lock.write():
+            book = Book(title, author, year)
+            super().add_book(book)
+            return book
+
+    def add_book(self, book: Book):
+        return self.__write(super().add_book, book)
+
+    def add_books(self, books):
+        return self.__write(super().add_books, books)
+
+    def update_book(self, book_id, title=None, author=None, year=None):
+        return self.__write(super().update_book, book_id, title, author, year)
+
+    def delete_book_by_id(self, book_id):
+        return self.__write(super().delete_book_by_id, book_id)
+
+    def sort_books(self, key):
+        return self.__write(super().sort_books, key)
+
+    def get_book_by_id(self, book_id):
+        return self.__read(super().get_book_by_id, book_id)
+
+    def find_by_author(self, author):
+        return self.__read(super().find_by_author, author)
+
+    def find_by_year(self, year):
+        return self.__read(super().find_by_year, year)
+
+    def find_by_year_range(self, start, end):
+        return self.__read(super().find_by_year_range, start, end)
+
+    def count_in_year_range(self, start, end):
+        return self.__read(super().count_in_year_range, start, end)
+
+    def count_by_year(self):
+        return self.__read(super().count_by_year)
+
+    def count_by_decade(self):
+        return self.__read(super().count_by_decade)
+
+    def iter_books(self, key=None):
+        # გენერატორი ბლოკის გარეთ ვერ დაიხარჯება — ვაბრუნებთ ასლს
+        with self._lock.read():
+            return list(super().iter_books(key))
+
+    def list_books(self, key=None, offset=0, limit=PAGE_SIZE):
+        with self._lock.read():
+            return list(islice(super().iter_books(key), offset, offset + limit))
+
+    def search_by_title(self, query):
+        # მოკლე მოთხოვნა ტრიგრამების ინდექსს არ აგებს — მას მზადყოფნად ვერ მოვნიშნავთ
+        if len(collation_key(query)) < NGRAM:
+            return self.__read(super().search_by_title, query)
+        return self.__lazy("grams", super().search_by_title, query)
+
+    def fuzzy_search(self, query, max_distance=2, limit=20):
+        # უფრო დიდი მანძილი ინდექსს თავიდან აგებს — ამიტომ ცალკე მზადყოფნის სახელი
+        name = "fuzzy" if max_distance <= 2 else f"fuzzy{max_distance}"
+        return self.__lazy(name, super().fuzzy_search, query, max_distance, limit)
+
+    def find_duplicates(self, threshold=0.5):
+        return self.__lazy("lsh", super().find_duplicates, threshold)
+
+    def open_journal(self, filename="books.json", **options):
+        with self._lock.write():
+            self.__ready.clear()
+            return super().open_journal(filename, **options)
+
+    def load_from_file(self, filename="books.json"):
+        return self.__write(super().load_from_file, filename, reset=True)
+
+    def load_trusted(self, filename="books.jsonl"):
+        return self.__write(super().load_trusted, filename, reset=True)
+
+    def compact(self):
+        return self.__write(super().compact)
+
+    def close_journal(self):
+        return self.__write(super().close_journal)
+
+
+def book_to_dict(book):
+    return {"id": book.id, "title": book.title, "author": book.author, "year": book.year}
+
+
+def request_text(request, field, required=True):
+    # ტექსტური ველი; არასწორი ტიპი ValueError-ია, სანამ მენეჯერამდე მივა
+    value = request[field] if required else request.get(field)
+    if value is None and not required:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"ველი '{field}' უნდა იყოს ტექსტი.")
+    return value
+
+
+def request_int(request, field, default=None):
+    # მთელი რიცხვი ან ციფრებიანი ტექსტი ("5"); default=None — ველი სავალდებულოა
+    value = request[field] if default is None else request.get(field, default)
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError(f"ველი '{field}' უნდა იყოს მთელი რიცხვი.")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"ველი '{field}' უნდა იყოს მთელი რიცხვი.") from None
+
+
+def dispatch(manager, request):
+    # ერთი JSON მოთხოვნის შესრულება; შეცდომისას ValueError / KeyError / TypeError
+    if not isinstance(request, dict):
+        raise ValueError("მოთხოვნა უნდა იყოს JSON ობიექტი.")
+    op = request["op"]
+    limit = request_int(request, "limit", PAGE_SIZE)
+    if op == "add":
+        book = manager.create_book(request_text(request, "title"), request_text(request, "author"),
+                                   request_int(request, "year"))
+        return book_to_dict(book)
+    if op == "search":
+        return [book_to_dict(b) for b in manager.search_by_title(request_text(request, "query"))[:limit]]
+    if op == "get":
+        book = manager.get_book_by_id(request_int(request, "id"))
+        return book_to_dict(book) if book else None
+    if op == "edit":
+        year = request_int(request, "year") if request.get("year") is not None else None
+        return manager.update_book(request_int(request, "id"), request_text(request, "title", False),
+                                   request_text(request, "author", False), year)
+    if op == "delete":
+        return manager.delete_book_by_id(request_int(request, "id"))
+    if op == "list":
+        key = request.get("sort")
+        if key is not None and key not in BookManager.SORT_KEYS:
+            raise ValueError(f"უცნობი დალაგება: {key}")
+        books = manager.list_books(key, request_int(request, "offset", 0), limit)
+        return [book_to_dict(b) for b in books]
+    raise ValueError(f"უცნობი ოპერაცია: {op}")
+
+
+async def handle_client(manager, executor, reader, writer):
+    # ხაზით გამოყოფილი JSON: ერთი მოთხოვნა -> ერთი პასუხი იმავე რიგით
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                # ხაზი StreamReader-ის ლიმიტზე (64 KiB) გრძელია — მისი დარჩენილი
+                # ნაწილი შემდეგ მოთხოვნად წაიკითხებოდა, ამიტომ კავშირს ვხურავთ
+                response = {"ok": False, "error": "მოთხოვნა ზედმეტად გრძელია."}
+                writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()
+                break
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+                result = await loop.run_in_executor(executor, dispatch, manager, request)
+                response = {"ok": True, "result": result}
+            except KeyError as e:
+                response = {"ok": False, "error": f"აკლია ველი: {e}"}
+            except (ValueError, TypeError) as e:
+                response = {"ok": False, "error": str(e)}
+            except Exception as e:
+                # მოულოდნელი შეცდომა ერთ მოთხოვნაში კავშირს არ წყვეტს
+                response = {"ok": False, "error": f"შიდა შეცდომა: {type(e).__name__}"}
+            writer.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+def serve(manager, host="127.0.0.1", port=8765, socket_path=None, workers=8):
+    # მოთხოვნები ნაკადების აუზში სრულდება, რომ ძიებებმა event loop არ დაბლოკონ
+    executor = ThreadPoolExecutor(max_workers=workers)
+
+    async def main():
+        def client(reader, writer):
+            return handle_client(manager, executor, reader, writer)
+
+        if socket_path:
+            server = await asyncio.start_unix_server(client, socket_path)
+            print(f"სერვერი მუშაობს: {socket_path}")
+        else:
+            server = await asyncio.start_server(client, host, port)
+            print(f"სერვერი მუშაობს: {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("სერვერი გაჩერდა.")
+    finally:
+        executor.shutdown()
+        manager.compact()
+        manager.close()
+
 
 # ============================
 #           MAIN
 # ============================
-def run():
-    manager = BookManager()
-    manager.load_from_file()
+def run(manager=None):
+    if manager is None:
+        manager = BookManager()
+        manager.open_journal()
 
     while True:
         print("\n==== მენიუ ====")
@@ -178,6 +1975,9 @@ def run():
         print("4. წიგნის წაშლა")
         print("5. წიგნის რედაქტირება")
         print("6. ფაილში შენახვა")
+        print("7. ძიება წლების შუალედით")
+        print("8. სტატისტიკა ათწლეულების მიხედვით")
+        print("9. სავარაუდო დუბლიკატები")
         print("0. გამოსვლა")
 
         choice = input("აირჩიეთ: ").strip()
@@ -220,12 +2020,29 @@ def run():
             elif sc == "3":
                 manager.sort_books("year")
 
-            manager.show_books()
+            # გვერდებად: თითო გვერდი ერთი write-ით
+            shown = 0
+            for page in manager.iter_pages():
+                if shown:
+                    more = input("Enter — შემდეგი გვერდი, 0 — შეწყვეტა: ").strip()
+                    if more == "0":
+                        break
+                shown += write_listing(page, start=shown + 1)
+            if not shown:
+                print("!!! სია ცარიელია.")
 
         # ---------- SEARCH ----------
         elif choice == "3":
             q = input("შეიყვანეთ წიგნის სათაური (ან მისი ნაწილი): ")
             res = manager.search_by_title(q)
+            fuzzy_search = getattr(manager, "fuzzy_search", None)
+            if not res and fuzzy_search:
+                similar = fuzzy_search(q, limit=10)
+                if similar:
+                    print("ზუსტად ვერ მოიძებნა. შესაძლოა გულისხმობდით:")
+                    for d, b in similar:
+                        print(f"  {b}")
+                    continue
             if not res:
                 print("ვერ მოიძებნა.")
             else:
@@ -321,11 +2138,50 @@ def run():
 
         # ---------- SAVE ----------
         elif choice == "6":
-            manager.save_to_file()
+            manager.compact()
             print("შენახულია.")
 
+        # ---------- YEAR RANGE ----------
+        elif choice == "7":
+            ok_from, year_from = validate_year(input("წლიდან: "))
+            ok_to, year_to = validate_year(input("წლამდე: "))
+            if not ok_from or not ok_to:
+                print("!!!", year_from if not ok_from else year_to)
+                continue
+            if year_from > year_to:
+                print("!!! საწყისი წელი საბოლოოზე მეტია.")
+                continue
+
+            res = manager.find_by_year_range(year_from, year_to)
+            if not res:
+                print("ვერ მოიძებნა.")
+            else:
+                for b in res:
+                    print(b)
+                print(f"სულ: {len(res)}")
+
+        # ---------- DECADES ----------
+        elif choice == "8":
+            stats = manager.count_by_decade()
+            if not stats:
+                print("!!! სია ცარიელია.")
+            for decade, count in stats.items():
+                print(f"{decade}-იანები: {count}")
+
+        # ---------- DUPLICATES ----------
+        elif choice == "9":
+            find_duplicates = getattr(manager, "find_duplicates", None)
+            clusters = find_duplicates() if find_duplicates else []
+            if not clusters:
+                print("დუბლიკატები ვერ მოიძებნა.")
+            for n, cluster in enumerate(clusters, start=1):
+                print(f"--- ჯგუფი {n} ---")
+                for b in cluster:
+                    print(f"  {b}")
+
         # ---------- EXIT ----------
         elif choice == "0":
+            manager.close()
             print("ნახვამდის.")
             break
 
@@ -333,4 +2189,119 @@ def run():
             print("არასწორი არჩევანი.")
 
 
-run()
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="წიგნების მართვის კონსოლ აპლიკაცია")
+    parser.add_argument("--sqlite", metavar="DB", help="SQLite ბაზის გამოყენება books.json-ის ნაცვლად")
+    parser.add_argument("--columnar", metavar="JSONL",
+                        help="სვეტური რეჟიმი: კატალოგი სანდო .jsonl ფაილიდან, Book ობიექტების გარეშე")
+    parser.add_argument("--snapshot", default="books.json",
+                        help="ჟურნალის snapshot ფაილი (.jsonl — სანდო სწრაფი ფორმატი)")
+    commands = parser.add_subparsers(dest="command")
+
+    pack = commands.add_parser("pack", help="books.json-ის გადაყვანა სანდო .jsonl ფორმატში")
+    pack.add_argument("source", nargs="?", default="books.json")
+    pack.add_argument("target", nargs="?", default="books.jsonl")
+
+    bulk = commands.add_parser("import", help="CSV/JSONL კატალოგის მასობრივი იმპორტი")
+    bulk.add_argument("file")
+    bulk.add_argument("--workers", type=int, default=None, help="ვალიდაციის პროცესების რაოდენობა")
+    bulk.add_argument("--chunk-size", type=int, default=5000)
+    bulk.add_argument("--report", help="უარყოფილი სტრიქონების CSV ანგარიში")
+
+    export = commands.add_parser("export", help="სიის ნაკადური ექსპორტი ფაილში ან stdout-ში")
+    export.add_argument("file", nargs="?", default="-")
+    export.add_argument("--sort", choices=BookManager.SORT_KEYS)
+
+    dedup = commands.add_parser("dedup", help="სავარაუდო დუბლიკატების ანგარიში")
+    dedup.add_argument("--threshold", type=float, default=0.5)
+
+    server = commands.add_parser("serve", help="კატალოგის JSON სერვერი ერთდროული კლიენტებისთვის")
+    server.add_argument("--host", default="127.0.0.1")
+    server.add_argument("--port", type=int, default=8765)
+    server.add_argument("--socket", help="Unix socket-ის გზა TCP-ის ნაცვლად")
+    server.add_argument("--workers", type=int, default=8, help="მოთხოვნების ნაკადების რაოდენობა")
+
+    migrate = commands.add_parser("migrate", help="books.json-ის გადატანა SQLite ბაზაში")
+    migrate.add_argument("source", nargs="?", default="books.json")
+    migrate.add_argument("db", nargs="?", default="books.db")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "migrate":
+        manager = SQLiteBookManager(args.db)
+        try:
+            count = manager.migrate_from_json(args.source)
+        except KeyError as e:
+            print(f"!!! ჩანაწერს აკლია ველი: {e}")
+            sys.exit(1)
+        except (OSError, ValueError) as e:
+            print(f"!!! {e}")
+            sys.exit(1)
+        finally:
+            manager.close()
+        print(f"გადატანილია {count} წიგნი: {args.source} -> {args.db}")
+        return
+
+    if args.command == "pack":
+        manager = BookManager()
+        manager.load_from_file(args.source)
+        manager.save_trusted(args.target)
+        print(f"შენახულია: {args.target}")
+        return
+
+    # stdout-ში ექსპორტისას სტატუსის შეტყობინებები stderr-ში მიდის, რომ სიას არ აერიოს
+    with redirect_stdout(sys.stderr if args.command == "export" else sys.stdout):
+        if args.command == "serve":
+            if args.sqlite or args.columnar:
+                print("!!! სერვერის რეჟიმი მხოლოდ books.json-თან მუშაობს.")
+                return
+            manager = ConcurrentBookManager()
+            manager.open_journal(args.snapshot)
+        elif args.sqlite:
+            manager = SQLiteBookManager(args.sqlite)
+        elif args.columnar:
+            try:
+                manager = ColumnarBookManager(args.columnar)
+            except ValueError as e:
+                # დაზიანებულ ფაილს ცარიელი კატალოგით არ გადავაწერთ
+                print(f"!!! {e}")
+                sys.exit(1)
+        else:
+            manager = BookManager()
+            manager.open_journal(args.snapshot)
+
+    if args.command == "export":
+        export_listing(manager, args.file, args.sort)
+        manager.close()
+        return
+
+    if args.command == "dedup":
+        if not hasattr(manager, "find_duplicates"):
+            print("!!! დუბლიკატების ძიება ამ რეჟიმში არ არის ხელმისაწვდომი.")
+        else:
+            clusters = manager.find_duplicates(args.threshold)
+            for n, cluster in enumerate(clusters, start=1):
+                print(f"--- ჯგუფი {n} ---")
+                for b in cluster:
+                    print(f"  {b}")
+            print(f"სულ {len(clusters)} ჯგუფი.")
+        manager.close()
+        return
+
+    if args.command == "serve":
+        serve(manager, args.host, args.port, args.socket, args.workers)
+        return
+
+    if args.command == "import":
+        summary = import_catalog(manager, args.file, args.workers, args.chunk_size, args.report)
+        for line_no, reason in summary.get("rejections", [])[:20]:
+            print(f"  ხაზი {line_no}: {reason}")
+        manager.compact()
+        manager.close()
+        return
+
+    run(manager)
+
+
+if __name__ == "__main__":
+    main()